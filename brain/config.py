@@ -6,8 +6,45 @@ This module provides functions for loading and parsing the
 """
 
 import os
-import configparser
-from typing import Dict, Any, Optional
+import sys
+import mmap
+import collections
+import copy
+import stat
+import types
+from typing import Callable, Dict, Any, List, Optional, TextIO, BinaryIO, Tuple, Union
+
+
+# Opt-in in-process cache of parsed configurations: (kind, absolute path) -> (file stamp, config),
+# least recently used first. See _memoized_load and clear_load_cache.
+_LOAD_CACHE: 'collections.OrderedDict[Tuple[str, str], Tuple[Tuple[int, ...], Dict[str, Any]]]' = collections.OrderedDict()
+_LOAD_CACHE_SIZE = 128
+
+# Allowed [EXPORT] permissions and the [SYNC_POLICY] keys whose values are booleans.
+_EXPORT_PERMISSIONS = frozenset(('readonly', 'readwrite'))
+_BOOLEAN_SYNC_POLICIES = frozenset((
+    'AUTO_SYNC_ON_PULL', 'ALLOW_LOCAL_MODIFICATIONS', 'ALLOW_PUSH_TO_BRAIN', 'AUTO_SYNC_ON_CHECKOUT'
+))
+
+# Accepted boolean spellings, precomputed in lower, Title and UPPER case so the usual
+# spellings resolve with one lookup; other casings fall back to str.lower().
+_BOOLEAN_VALUES = {
+    spelling: flag
+    for token, flag in (('true', True), ('yes', True), ('1', True), ('false', False), ('no', False), ('0', False))
+    for spelling in (token, token.title(), token.upper())
+}
+
+# Read-only default [SYNC_POLICY] values, used for every key a .neurons file leaves out.
+DEFAULT_SYNC_POLICY = types.MappingProxyType({
+    'AUTO_SYNC_ON_PULL': True,
+    'CONFLICT_STRATEGY': 'prompt',
+    'ALLOW_LOCAL_MODIFICATIONS': False,
+    'ALLOW_PUSH_TO_BRAIN': False,
+    'AUTO_SYNC_ON_CHECKOUT': False # Adding this based on checkout.py usage
+})
+
+# Fields of each [MAP] mapping dict, in the order map_columns reports them.
+_MAP_FIELDS = ('brain_id', 'source', 'destination', '_map_key')
 
 
 class BrainConfigError(Exception):
@@ -32,13 +69,180 @@ class NeuronsConfigError(Exception):
     pass
 
 
-def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
+def _load_config_mapped(file_path: str, load_stream: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Description:
+        Memory-map a configuration file read-only and hand the mapping to a stream
+        loader, which decodes it as UTF-8. Empty files cannot be mapped and are
+        passed to the loader as a regular binary file instead.
+    
+    Parameters:
+        file_path (str): Path to the configuration file
+        load_stream (Callable): load_brain_config_stream or load_neurons_config_stream
+    
+    Returns:
+        config (Dict[str, Any]): The configuration returned by load_stream
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return load_stream(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            return load_stream(mapping)
+
+
+def _memoized_load(file_path: str, kind: str, load_stream: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Description:
+        Load a configuration file through the in-process LRU cache. Entries are keyed
+        by kind and absolute path and are reused only while the file's mtime, ctime,
+        size and inode are unchanged (an atomic save replaces the inode; an in-place
+        write moves the ctime). The cache keeps the parsed configuration itself and
+        hands out deep copies, so callers may edit what they get back.
+    
+    Parameters:
+        file_path (str): Path to the configuration file
+        kind (str): 'brain' or 'neurons', keeping the two loaders' entries apart
+        load_stream (Callable): load_brain_config_stream or load_neurons_config_stream
+    
+    Returns:
+        config (Dict[str, Any]): The parsed configuration
+    """
+    st = os.stat(file_path)
+    stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+    key = (kind, os.path.abspath(file_path))
+    entry = _LOAD_CACHE.get(key)
+    if entry is None or entry[0] != stamp:
+        config = _load_config_mapped(file_path, load_stream)
+        entry = _LOAD_CACHE[key] = (stamp, config)
+    _LOAD_CACHE.move_to_end(key)
+    if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+        _LOAD_CACHE.popitem(last=False)
+    return copy.deepcopy(entry[1])  # The entry itself never leaves the cache
+
+
+def clear_load_cache() -> None:
+    """
+    Description:
+        Drop every configuration held by the in-process load cache, so the next load
+        of each file parses it again.
+    
+    Parameters:
+        None
+    
+    Returns:
+        None
+    """
+    _LOAD_CACHE.clear()
+
+
+def _parse_bool(value: str) -> Optional[bool]:
+    """
+    Description:
+        Interpret a stripped configuration value as a boolean.
+    
+    Parameters:
+        value (str): Stripped value, e.g. 'true', 'No' or '1'
+    
+    Returns:
+        flag (Optional[bool]): True/False for an accepted spelling, None otherwise
+    """
+    flag = _BOOLEAN_VALUES.get(value)
+    if flag is None:
+        flag = _BOOLEAN_VALUES.get(value.lower())
+    return flag
+
+
+# Kind of a stripped INI line, looked up by its first character; anything else is a key line.
+_KEY_LINE, _SECTION_LINE, _COMMENT_LINE = 0, 1, 2
+_LINE_KINDS = {'[': _SECTION_LINE, '#': _COMMENT_LINE, ';': _COMMENT_LINE}
+
+
+def _scan_ini(content: str) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Description:
+        Single-pass scanner for the INI dialect used by .brain and .neurons files.
+        It follows ConfigParser(strict=True, allow_no_value=True) with case-preserving
+        keys: full-line '#'/';' comments, keys split at the first '=' or ':', keys
+        without a value map to None, indented lines continue the previous value, and
+        duplicate sections or keys are rejected. Values are not interpolated. Section
+        names and keys are interned, since the same few names recur in every file.
+    
+    Parameters:
+        content (str): Decoded configuration text
+    
+    Returns:
+        sections (Dict[str, Dict[str, Optional[str]]]): Options per section, in file order
+    
+    Raises:
+        ValueError: If a line cannot be parsed or a section/key is duplicated
+    """
+    sections: Dict[str, Dict[str, Optional[str]]] = {}
+    current: Optional[Dict[str, Optional[str]]] = None
+    section_name = key = None
+    key_indent = blank_lines = 0
+    # Module lookups bound to locals once, outside the per-line loop.
+    line_kind, intern, key_line = _LINE_KINDS.get, sys.intern, _KEY_LINE
+    for lineno, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped:
+            blank_lines += 1
+            continue
+        kind = line_kind(stripped[0], key_line)
+        if kind == _COMMENT_LINE:
+            continue
+        
+        # ===============
+        # Continuation of the previous key's value (blank lines in between are kept).
+        # ===============
+        indent = len(line) - len(line.lstrip())
+        if current is not None and key is not None and current[key] is not None and indent > key_indent:
+            current[key] += '\n' * (blank_lines + 1) + stripped
+            blank_lines = 0
+            continue
+        blank_lines = 0
+        
+        # ===============
+        # Section header: '[' up to the last ']' on the line, which must enclose a name.
+        # ===============
+        if kind == _SECTION_LINE:
+            end = stripped.rfind(']')
+            if end > 1:
+                section_name = intern(stripped[1:end])
+                if section_name in sections:
+                    raise ValueError(f"line {lineno}: section '{section_name}' already exists")
+                current = sections[section_name] = {}
+                key = None
+                continue
+        
+        # ===============
+        # Key line: split at the first '=' or ':'; a bare key has no value.
+        # ===============
+        eq, colon = stripped.find('='), stripped.find(':')
+        split_at = colon if eq < 0 or 0 <= colon < eq else eq
+        if split_at < 0:
+            key, value = intern(stripped), None
+        else:
+            key, value = intern(stripped[:split_at].rstrip()), stripped[split_at + 1:].lstrip()
+        if current is None:
+            raise ValueError(f"line {lineno}: '{stripped}' appears before any section header")
+        if not key:
+            raise ValueError(f"line {lineno}: missing key in '{stripped}'")
+        if key in current:
+            raise ValueError(f"line {lineno}: option '{key}' in section '{section_name}' already exists")
+        current[key] = value
+        key_indent = indent
+    return sections
+
+
+def load_brain_config(file_path: str = '.brain', memoize: bool = False) -> Dict[str, Any]:
     """
     Description:
         Load and parse a .brain configuration file.
     
     Parameters:
         file_path (str): Path to the .brain file (default: '.brain')
+        memoize (bool): Serve repeated loads of an unchanged file from an in-process
+                        cache; meant for long-lived callers (default: False)
     
     Returns:
         config (Dict[str, Any]): Parsed brain configuration containing ID, DESCRIPTION,
@@ -48,32 +252,50 @@ def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
     Raises:
         BrainConfigError: If the configuration file is not found or has invalid format
     """
-    # --------------------------------------------------------------
-    # STEP 1: Verify file existence.
-    # --------------------------------------------------------------
     if not os.path.exists(file_path):
         raise BrainConfigError(f"Brain configuration file not found: {file_path}")
     
+    if memoize:
+        return _memoized_load(file_path, 'brain', load_brain_config_stream)
+    return _load_config_mapped(file_path, load_brain_config_stream)
+
+
+def load_brain_config_stream(stream: Union[TextIO, BinaryIO]) -> Dict[str, Any]:
+    """
+    Description:
+        Parse .brain configuration content from an open stream (a file object,
+        io.StringIO or io.BytesIO). Binary content is decoded as UTF-8.
+    
+    Parameters:
+        stream (Union[TextIO, BinaryIO]): Stream positioned at the start of the .brain content
+    
+    Returns:
+        config (Dict[str, Any]): Parsed brain configuration, as returned by load_brain_config
+    
+    Raises:
+        BrainConfigError: If the configuration has invalid format
+    """
     # --------------------------------------------------------------
-    # STEP 2: Initialize configuration and parser.
+    # STEP 1: Initialize configuration.
     # --------------------------------------------------------------
     config: Dict[str, Any] = {} # Initialize config dict
-    parser = configparser.ConfigParser(strict=True, allow_no_value=True)
-    parser.optionxform = str  # Preserve case sensitivity in keys
 
     try:
         # --------------------------------------------------------------
-        # STEP 3: Read and parse the configuration file.
+        # STEP 2: Read and parse the configuration stream.
         # --------------------------------------------------------------
-        parser.read(file_path)
+        content = stream.read()
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        sections = _scan_ini(content)
         
         # --------------------------------------------------------------
-        # STEP 4: Validate and extract the BRAIN section.
+        # STEP 3: Validate and extract the BRAIN section.
         # --------------------------------------------------------------
-        if 'BRAIN' not in parser:
+        if 'BRAIN' not in sections:
             raise BrainConfigError("Missing required [BRAIN] section")
         
-        brain_section = parser['BRAIN']
+        brain_section = sections['BRAIN']
         
         if 'ID' not in brain_section:
             raise BrainConfigError("Missing required ID field in [BRAIN] section")
@@ -85,13 +307,13 @@ def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
             config['DESCRIPTION'] = brain_section['DESCRIPTION']
         
         # --------------------------------------------------------------
-        # STEP 5: Validate and extract the EXPORT section.
+        # STEP 4: Validate and extract the EXPORT section.
         # --------------------------------------------------------------
-        if 'EXPORT' not in parser:
+        if 'EXPORT' not in sections:
             raise BrainConfigError("Missing required [EXPORT] section")
         
         config['EXPORT'] = {}
-        for path_pattern, permission_str in parser['EXPORT'].items():
+        for path_pattern, permission_str in sections['EXPORT'].items():
             # Clean up path pattern
             path_pattern = path_pattern.strip()
             
@@ -108,18 +330,18 @@ def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
                 continue 
             
             # Validate permission values
-            if permission_str not in ['readonly', 'readwrite']:
+            if permission_str not in _EXPORT_PERMISSIONS:
                 raise BrainConfigError(f"Invalid permission '{permission_str}' for path '{path_pattern}'")
             
             # Store path with its permission
             config['EXPORT'][path_pattern] = permission_str
         
         # --------------------------------------------------------------
-        # STEP 6: Extract optional ACCESS section if present.
+        # STEP 5: Extract optional ACCESS section if present.
         # --------------------------------------------------------------
-        if 'ACCESS' in parser:
+        if 'ACCESS' in sections:
             config['ACCESS'] = {}
-            for entity, paths_str in parser['ACCESS'].items():
+            for entity, paths_str in sections['ACCESS'].items():
                 entity = entity.strip() # Ensure entity key is stripped
                 
                 # Handle empty paths list
@@ -132,11 +354,11 @@ def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
                 config['ACCESS'][entity] = path_list
         
         # --------------------------------------------------------------
-        # STEP 7: Extract optional UPDATE_POLICY section if present.
+        # STEP 6: Extract optional UPDATE_POLICY section if present.
         # --------------------------------------------------------------
-        if 'UPDATE_POLICY' in parser:
+        if 'UPDATE_POLICY' in sections:
             config['UPDATE_POLICY'] = {}
-            for key, value_str in parser['UPDATE_POLICY'].items():
+            for key, value_str in sections['UPDATE_POLICY'].items():
                 # Handle empty values for policies
                 if value_str is None: 
                     # Determine default or raise error for empty UPDATE_POLICY values
@@ -147,36 +369,112 @@ def load_brain_config(file_path: str = '.brain') -> Dict[str, Any]:
                     continue # Or, if strict, raise error.
 
                 # Process based on value type
-                value_str_lower = value_str.lower().strip() # Strip value before comparison
+                flag = _parse_bool(value_str.strip()) # Strip value before comparison
                 
                 # ===============
-                # Sub step 7.1: Handle boolean values.
+                # Sub step 6.1: Handle boolean values.
                 # ===============
-                if value_str_lower in ['true', 'yes', '1']:
-                    config['UPDATE_POLICY'][key] = True
-                elif value_str_lower in ['false', 'no', '0']:
-                    config['UPDATE_POLICY'][key] = False
+                if flag is not None:
+                    config['UPDATE_POLICY'][key] = flag
                 
                 # ===============
-                # Sub step 7.2: Handle PROTECTED_PATHS specially.
+                # Sub step 6.2: Handle PROTECTED_PATHS specially.
                 # ===============
                 # Check for specific keys that expect list values, like PROTECTED_PATHS
-                # This check must be case-sensitive as parser.optionxform = str
+                # This check must be case-sensitive as keys keep their case
                 elif key == 'PROTECTED_PATHS': 
                     config['UPDATE_POLICY'][key] = [p.strip() for p in value_str.split(',') if p.strip()]
                 
                 # ===============
-                # Sub step 7.3: Handle all other values as strings.
+                # Sub step 6.3: Handle all other values as strings.
                 # ===============
                 else:
                     config['UPDATE_POLICY'][key] = value_str.strip() # Store other values as stripped strings
     
-    except (configparser.Error, ValueError) as e: # ValueError for things like int conversion if attempted
+    except ValueError as e: # Raised by _scan_ini and for invalid UTF-8 content
         raise BrainConfigError(f"Error parsing brain configuration: {str(e)}")
     
     return config
 
 
+def _format_ini(sections: Dict[str, Dict[str, str]]) -> str:
+    """
+    Description:
+        Render sections as INI text in the layout ConfigParser.write produces:
+        '[SECTION]', one 'key = value' line per option (continuation lines indented
+        with a tab) and a blank line after each section.
+    
+    Parameters:
+        sections (Dict[str, Dict[str, str]]): Options per section, in output order
+    
+    Returns:
+        str: The formatted INI text
+    """
+    parts = []
+    for section_name, options in sections.items():
+        parts.append(f"[{section_name}]\n")
+        for key, value in options.items():
+            value = value.replace('\n', '\n\t')
+            parts.append(f"{key} = {value}\n")
+        parts.append("\n")
+    return ''.join(parts)
+
+
+def _write_file_atomic(file_path: str, data: bytes) -> None:
+    """
+    Description:
+        Write data to a temporary file next to file_path and rename it over
+        file_path, so readers never see a partially written file. Symlinks are
+        resolved first, so the link's target is updated and the link is kept, and
+        the existing file's permission bits are carried over. A new file is created
+        with 0o666, so the kernel applies the process umask.
+    
+    Parameters:
+        file_path (str): Destination path
+        data (bytes): Complete file contents
+    
+    Returns:
+        None
+    
+    Raises:
+        OSError: If the temporary file cannot be written or renamed
+    """
+    # --------------------------------------------------------------
+    # STEP 1: Resolve the target and the mode to carry over, if any.
+    # --------------------------------------------------------------
+    target_path = os.path.realpath(file_path)
+    try:
+        mode = stat.S_IMODE(os.stat(target_path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    
+    # --------------------------------------------------------------
+    # STEP 2: Create a uniquely named temporary file next to the target.
+    # --------------------------------------------------------------
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = f"{target_path}.{os.urandom(6).hex()}.tmp"
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    
+    # --------------------------------------------------------------
+    # STEP 3: Write the data and rename it over the target.
+    # --------------------------------------------------------------
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 def save_brain_config(config: Dict[str, Any], file_path: str = '.brain') -> None:
     """
     Description:
@@ -194,84 +492,82 @@ def save_brain_config(config: Dict[str, Any], file_path: str = '.brain') -> None
         BrainConfigError: If the configuration cannot be saved due to IO errors
     """
     # --------------------------------------------------------------
-    # STEP 1: Initialize configuration parser.
+    # STEP 1: Initialize the section mapping.
     # --------------------------------------------------------------
-    parser = configparser.ConfigParser()
-    parser.optionxform = str  # Preserve case sensitivity
+    sections: Dict[str, Dict[str, str]] = {}
 
     # --------------------------------------------------------------
     # STEP 2: Build BRAIN section.
     # --------------------------------------------------------------
-    parser['BRAIN'] = {}
+    sections['BRAIN'] = {}
     # Ensure ID is present, even if empty string, as it's schema-required (though load checks non-empty)
-    parser['BRAIN']['ID'] = config.get('ID', '') 
+    sections['BRAIN']['ID'] = config.get('ID', '') 
     
     # Only write DESCRIPTION if it's present in the config dict
     if 'DESCRIPTION' in config: # More explicit than config.get('DESCRIPTION') which might be None
-        parser['BRAIN']['DESCRIPTION'] = config['DESCRIPTION']
+        sections['BRAIN']['DESCRIPTION'] = config['DESCRIPTION']
     
     # --------------------------------------------------------------
     # STEP 3: Build EXPORT section.
     # --------------------------------------------------------------
-    parser['EXPORT'] = {} 
+    sections['EXPORT'] = {} 
     for path, permission in config.get('EXPORT', {}).items():
-        parser['EXPORT'][path] = str(permission) # Permissions are 'readonly' or 'readwrite' (strings)
+        sections['EXPORT'][path] = str(permission) # Permissions are 'readonly' or 'readwrite' (strings)
     
     # --------------------------------------------------------------
     # STEP 4: Build ACCESS section if present.
     # --------------------------------------------------------------
     # Only write ACCESS section if it has content in the config
     if config.get('ACCESS'): 
-        parser['ACCESS'] = {}
+        sections['ACCESS'] = {}
         for entity, paths_data in config['ACCESS'].items():
             # If it's not, ','.join will raise a TypeError.
             try:
-                parser['ACCESS'][entity] = ','.join(paths_data)
+                sections['ACCESS'][entity] = ','.join(paths_data)
             except TypeError: # Catches if paths_data is not an iterable of strings
                  # This indicates a malformed config input dict for 'ACCESS' paths.
                  # Production code might log this or raise a more specific internal error.
                  # For now, convert to string to avoid crashing save, but this path indicates bad input.
-                parser['ACCESS'][entity] = str(paths_data)
+                sections['ACCESS'][entity] = str(paths_data)
     
     # --------------------------------------------------------------
     # STEP 5: Build UPDATE_POLICY section if present.
     # --------------------------------------------------------------
     if config.get('UPDATE_POLICY'):
-        parser['UPDATE_POLICY'] = {}
+        sections['UPDATE_POLICY'] = {}
         for key, value in config['UPDATE_POLICY'].items():
             
             # ===============
             # Sub step 5.1: Handle boolean values.
             # ===============
             if type(value) is bool:
-                parser['UPDATE_POLICY'][key] = str(value).lower()
+                sections['UPDATE_POLICY'][key] = str(value).lower()
             
             # ===============
             # Sub step 5.2: Handle list values (like PROTECTED_PATHS).
             # ===============
             elif type(value) is list: # Check for list type specifically for join
                 try:
-                    parser['UPDATE_POLICY'][key] = ','.join(value)
+                    sections['UPDATE_POLICY'][key] = ','.join(value)
                 except TypeError: # If list contains non-strings
-                    parser['UPDATE_POLICY'][key] = str(value) # Fallback, indicates bad input
+                    sections['UPDATE_POLICY'][key] = str(value) # Fallback, indicates bad input
             
             # ===============
             # Sub step 5.3: Handle all other values.
             # ===============
             else:
-                parser['UPDATE_POLICY'][key] = str(value)
+                sections['UPDATE_POLICY'][key] = str(value)
     
     # --------------------------------------------------------------
     # STEP 6: Write configuration to file.
     # --------------------------------------------------------------
     try:
-        with open(file_path, 'w', encoding='utf-8') as f: # Ensure utf-8 encoding
-            parser.write(f)
+        _write_file_atomic(file_path, _format_ini(sections).encode('utf-8'))
     except (IOError, OSError) as e:
         raise BrainConfigError(f"Error saving brain configuration: {str(e)}")
 
 
-def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
+def load_neurons_config(file_path: str = '.neurons', memoize: bool = False) -> Dict[str, Any]:
     """
     Description:
         Load and parse a .neurons configuration file, which defines brain connections
@@ -279,6 +575,8 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
     
     Parameters:
         file_path (str): Path to the .neurons file (default: '.neurons')
+        memoize (bool): Serve repeated loads of an unchanged file from an in-process
+                        cache; meant for long-lived callers (default: False)
     
     Returns:
         config (Dict[str, Any]): Parsed neurons configuration containing BRAINS connections,
@@ -287,52 +585,59 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
     Raises:
         NeuronsConfigError: If the configuration file is not found or has invalid format
     """
-    # --------------------------------------------------------------
-    # STEP 1: Verify file existence.
-    # --------------------------------------------------------------
     if not os.path.exists(file_path):
         raise NeuronsConfigError(f"Neurons configuration file not found: {file_path}")
     
+    if memoize:
+        return _memoized_load(file_path, 'neurons', load_neurons_config_stream)
+    return _load_config_mapped(file_path, load_neurons_config_stream)
+
+
+def load_neurons_config_stream(stream: Union[TextIO, BinaryIO]) -> Dict[str, Any]:
+    """
+    Description:
+        Parse .neurons configuration content from an open stream (a file object,
+        io.StringIO or io.BytesIO). Binary content is decoded as UTF-8.
+    
+    Parameters:
+        stream (Union[TextIO, BinaryIO]): Stream positioned at the start of the .neurons content
+    
+    Returns:
+        config (Dict[str, Any]): Parsed neurons configuration, as returned by load_neurons_config
+    
+    Raises:
+        NeuronsConfigError: If the configuration has invalid format
+    """
     # --------------------------------------------------------------
-    # STEP 2: Initialize configuration with defaults.
+    # STEP 1: Initialize configuration with defaults.
     # --------------------------------------------------------------
     config: Dict[str, Any] = { 
         'BRAINS': {},
-        'SYNC_POLICY': { # Define all default sync policies explicitly
-            'AUTO_SYNC_ON_PULL': True,
-            'CONFLICT_STRATEGY': 'prompt',
-            'ALLOW_LOCAL_MODIFICATIONS': False,
-            'ALLOW_PUSH_TO_BRAIN': False,
-            'AUTO_SYNC_ON_CHECKOUT': False # Adding this based on checkout.py usage
-        },
+        # Mutable copy: commands update SYNC_POLICY in place before saving
+        'SYNC_POLICY': dict(DEFAULT_SYNC_POLICY),
         'MAP': []
     }
     
-    # Initialize parser with strict mode enabled
-    parser = configparser.ConfigParser(strict=True, allow_no_value=True)
-    parser.optionxform = str  # Preserve case sensitivity in keys
-
     try:
         # --------------------------------------------------------------
-        # STEP 3: Read and parse the configuration file.
+        # STEP 2: Read and parse the configuration stream.
         # --------------------------------------------------------------
-        # Ensure reading with UTF-8, as it's saved with UTF-8
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        parser.read_string(content)
+        content = stream.read()
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        sections = _scan_ini(content)
         
         # --------------------------------------------------------------
-        # STEP 4: Process BRAIN sections.
+        # STEP 3: Process BRAIN sections.
         # --------------------------------------------------------------
-        for section_name in parser.sections():
+        for section_name in sections:
             if section_name.startswith('BRAIN:'):
                 # Extract brain ID from section name
-                brain_id = section_name[len('BRAIN:'):].strip()
+                brain_id = sys.intern(section_name[len('BRAIN:'):].strip())
                 if not brain_id:
                     raise NeuronsConfigError(f"Empty brain ID in section name: '{section_name}'")
 
-                section_data = parser[section_name]
+                section_data = sections[section_name]
                 
                 # Validate required REMOTE field
                 remote_val = section_data.get('REMOTE')
@@ -353,11 +658,11 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
                     config['BRAINS'][brain_id]['ARGS'] = args_val.strip()
         
         # --------------------------------------------------------------
-        # STEP 5: Process SYNC_POLICY section if present.
+        # STEP 4: Process SYNC_POLICY section if present.
         # --------------------------------------------------------------
-        if 'SYNC_POLICY' in parser:
-            for key, value_str in parser['SYNC_POLICY'].items():
-                policy_key_upper = key.upper() # Standardize internal keys
+        if 'SYNC_POLICY' in sections:
+            for key, value_str in sections['SYNC_POLICY'].items():
+                policy_key_upper = sys.intern(key.upper()) # Standardize internal keys
                 
                 # Handle empty values
                 if value_str is None: # Handle key= (empty value)
@@ -371,32 +676,27 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
                         config['SYNC_POLICY'][policy_key_upper] = "" 
                     continue 
 
-                # Process values based on policy type
-                value_str_lower_stripped = value_str.lower().strip()
-                
                 # ===============
-                # Sub step 5.1: Handle boolean policies.
+                # Sub step 4.1: Handle boolean policies.
                 # ===============
-                if policy_key_upper in ['AUTO_SYNC_ON_PULL', 'ALLOW_LOCAL_MODIFICATIONS', 
-                                        'ALLOW_PUSH_TO_BRAIN', 'AUTO_SYNC_ON_CHECKOUT']: # Known boolean keys
-                    if value_str_lower_stripped in ['true', 'yes', '1']:
-                        config['SYNC_POLICY'][policy_key_upper] = True
-                    elif value_str_lower_stripped in ['false', 'no', '0']:
-                        config['SYNC_POLICY'][policy_key_upper] = False
+                if policy_key_upper in _BOOLEAN_SYNC_POLICIES: # Known boolean keys
+                    flag = _parse_bool(value_str.strip())
+                    if flag is not None:
+                        config['SYNC_POLICY'][policy_key_upper] = flag
                     else: # Invalid boolean value
                         raise NeuronsConfigError(f"Invalid boolean value '{value_str}' for '{key}' in [SYNC_POLICY]")
                 
                 # ===============
-                # Sub step 5.2: Handle string policies.
+                # Sub step 4.2: Handle string policies.
                 # ===============
                 else: # For other policies like CONFLICT_STRATEGY, store as stripped string
                     config['SYNC_POLICY'][policy_key_upper] = value_str.strip() 
         
         # --------------------------------------------------------------
-        # STEP 6: Process MAP section.
+        # STEP 5: Process MAP section.
         # --------------------------------------------------------------
         # Handle MAP section
-        if not parser.has_section('MAP'):
+        if 'MAP' not in sections:
              # If strict mode requires MAP section even if empty:
              raise NeuronsConfigError("Missing required [MAP] section")
 
@@ -405,27 +705,30 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
         if len(config['BRAINS']) == 1:
             default_brain_id = next(iter(config['BRAINS']))
 
-        # Check if MAP section actually has items. parser.items('MAP') is empty if section is `[MAP]\n`.
+        # Check if MAP section actually has items. sections['MAP'] is empty if section is `[MAP]\n`.
         # If section exists and has items, then proceed.
-        if parser.has_section('MAP'):
-            map_items = dict(parser.items('MAP'))
+        if 'MAP' in sections:
+            map_items = sections['MAP']
+            # One mapping per [MAP] key: preallocate the list and fill it by index.
+            mappings = config['MAP'] = [None] * len(map_items)
+            map_count = 0
             for map_key, map_value_str_raw in map_items.items():
                 # Validate map values
                 if map_value_str_raw is None or not map_value_str_raw.strip():
                     raise NeuronsConfigError(f"Empty value for mapping key '{map_key}' in [MAP] section.")
 
                 map_value_str = map_value_str_raw.strip()
-                parts = map_value_str.split('::')
-                
-                # Initialize mapping components
-                brain_id_in_map: Optional[str] = None
-                source_path: Optional[str] = None
-                dest_path: Optional[str] = None
+                # One split, then every part stripped in a single comprehension.
+                parts = [part.strip() for part in map_value_str.split('::')]
 
                 # ===============
-                # Sub step 6.1: Parse mapping format (2 or 3 parts).
+                # Sub step 5.1: Parse mapping format (3 or 2 parts).
                 # ===============
-                if len(parts) == 2:
+                if len(parts) == 3:
+                    # Format: brain_id::source::dest
+                    brain_id_in_map, source_path, dest_path = parts
+                    brain_id_in_map = sys.intern(brain_id_in_map) # Shared by every entry of this brain
+                elif len(parts) == 2:
                     # Format: source::dest (uses default brain)
                     if not default_brain_id:
                         raise NeuronsConfigError(
@@ -433,49 +736,70 @@ def load_neurons_config(file_path: str = '.neurons') -> Dict[str, Any]:
                             f"but no single default brain is defined, or multiple brains exist. Please specify brain_id."
                         )
                     brain_id_in_map = default_brain_id
-                    source_path = parts[0].strip()
-                    dest_path = parts[1].strip()
-                elif len(parts) == 3:
-                    # Format: brain_id::source::dest
-                    brain_id_in_map = parts[0].strip()
-                    source_path = parts[1].strip()
-                    dest_path = parts[2].strip()
+                    source_path, dest_path = parts
                 else:
                     raise NeuronsConfigError(f"Invalid mapping format for '{map_key} = {map_value_str}'. Expected 'brain_id::source::dest' or 'source::dest'.")
 
                 # ===============
-                # Sub step 6.2: Validate mapping components.
+                # Sub step 5.2: Validate mapping components.
                 # ===============
                 if not brain_id_in_map or not source_path or not dest_path:
                     raise NeuronsConfigError(f"Incomplete mapping for '{map_key} = {map_value_str}'. All parts (brain_id, source, destination) must be non-empty.")
 
-                if brain_id_in_map not in config['BRAINS']:
-                    raise NeuronsConfigError(f"Unknown brain '{brain_id_in_map}' in mapping '{map_key} = {map_value_str}'")
-                
                 # ===============
-                # Sub step 6.3: Add valid mapping to config.
+                # Sub step 5.3: Add valid mapping to config.
                 # ===============
-                config['MAP'].append({
+                mappings[map_count] = {
                     'brain_id': brain_id_in_map,
                     'source': source_path,
                     'destination': dest_path,
                     '_map_key': map_key.strip() # Store the original key from .neurons file
-                })
+                }
+                map_count += 1
+            del mappings[map_count:]
+            
+            # ===============
+            # Sub step 5.4: Reject mappings to undefined brains, reporting the first in file order.
+            # ===============
+            unknown_brain_ids = {mapping['brain_id'] for mapping in mappings}.difference(config['BRAINS'])
+            if unknown_brain_ids:
+                mapping = next(m for m in mappings if m['brain_id'] in unknown_brain_ids)
+                map_key = mapping['_map_key']
+                raise NeuronsConfigError(
+                    f"Unknown brain '{mapping['brain_id']}' in mapping '{map_key} = {map_items[map_key].strip()}'"
+                )
             
             # ===============
-            # Sub step 6.4: Validate that at least one mapping was processed.
+            # Sub step 5.5: Validate that at least one mapping was processed.
             # ===============
             # This check from original code implies that if MAP section exists, it must result in some valid mappings.
             # If map_items is not empty but config['MAP'] is, it means all items were invalid.
             if map_items and not config['MAP']:
                  raise NeuronsConfigError("No valid mappings defined in [MAP] section or all mappings were invalid.")
 
-    except (configparser.Error, ValueError) as e:
+    except ValueError as e:
         raise NeuronsConfigError(f"Error parsing neurons configuration: {str(e)}")
     
     return config
 
 
+def map_columns(config: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Description:
+        Return a column view of a neurons configuration's MAP: one list per mapping
+        field, in mapping order, for callers that scan a single field.
+    
+    Parameters:
+        config (Dict[str, Any]): Neurons configuration, as returned by load_neurons_config
+    
+    Returns:
+        columns (Dict[str, List[Any]]): 'brain_id', 'source', 'destination' and '_map_key'
+                                        lists (None where a mapping lacks the field)
+    """
+    mappings = config.get('MAP', [])
+    return {field: [mapping.get(field) for mapping in mappings] for field in _MAP_FIELDS}
+
+
 def save_neurons_config(config: Dict[str, Any], file_path: str = '.neurons') -> None:
     """
     Description:
@@ -493,35 +817,34 @@ def save_neurons_config(config: Dict[str, Any], file_path: str = '.neurons') ->
         NeuronsConfigError: If the configuration cannot be saved due to IO errors
     """
     # --------------------------------------------------------------
-    # STEP 1: Initialize configuration parser.
+    # STEP 1: Initialize the section mapping.
     # --------------------------------------------------------------
-    parser = configparser.ConfigParser()
-    parser.optionxform = str  # Preserve case sensitivity
+    sections: Dict[str, Dict[str, str]] = {}
 
     # --------------------------------------------------------------
     # STEP 2: Build BRAIN sections.
     # --------------------------------------------------------------
     for brain_id, brain_cfg_data in config.get('BRAINS', {}).items():
         section_name = f"BRAIN:{brain_id}"
-        parser[section_name] = {} # Ensure section is created
+        sections[section_name] = {} # Ensure section is created
         for key, value in brain_cfg_data.items():
-            parser[section_name][key] = str(value)
+            sections[section_name][key] = str(value)
     
     # --------------------------------------------------------------
     # STEP 3: Build SYNC_POLICY section if present.
     # --------------------------------------------------------------
     if config.get('SYNC_POLICY'): # Only write section if it has content
-        parser['SYNC_POLICY'] = {}
+        sections['SYNC_POLICY'] = {}
         for key, value in config['SYNC_POLICY'].items():
             if type(value) is bool:
-                parser['SYNC_POLICY'][key] = str(value).lower()
+                sections['SYNC_POLICY'][key] = str(value).lower()
             else:
-                parser['SYNC_POLICY'][key] = str(value) # For strings like 'prompt'
+                sections['SYNC_POLICY'][key] = str(value) # For strings like 'prompt'
     
     # --------------------------------------------------------------
     # STEP 4: Build MAP section.
     # --------------------------------------------------------------
-    parser['MAP'] = {} # Ensure MAP section is always present
+    sections['MAP'] = {} # Ensure MAP section is always present
     for i, mapping in enumerate(config.get('MAP', [])):
         # Use stored _map_key if available, otherwise generate one
         map_key_name = mapping.get('_map_key')
@@ -541,14 +864,13 @@ def save_neurons_config(config: Dict[str, Any], file_path: str = '.neurons') ->
 
         # Format the mapping string
         value_str = f"{b_id}::{src}::{dst}"
-        parser['MAP'][map_key_name] = value_str
+        sections['MAP'][map_key_name] = value_str
     
     # --------------------------------------------------------------
     # STEP 5: Write configuration to file.
     # --------------------------------------------------------------
     try:
-        with open(file_path, 'w', encoding='utf-8') as f: # Ensure utf-8 encoding
-            parser.write(f)
+        _write_file_atomic(file_path, _format_ini(sections).encode('utf-8'))
     except (IOError, OSError) as e:
         raise NeuronsConfigError(f"Error saving neurons configuration: {str(e)}")
 
@@ -4,7 +4,8 @@ Brain Git Extension - Local Brain and Neurons Simulation Demo (Direct Handler Ca
 
 This script demonstrates the 'brain' Git extension by directly calling
 the Python handler functions for 'brain' commands, creating a "virtual shell".
-Git operations for setup are still done via subprocess.
+Git operations for setup are done in-process through pygit2 when it is installed,
+and via subprocess otherwise.
 """
 
 import os
@@ -12,64 +13,103 @@ import shutil
 import subprocess
 import pathlib
 import sys
-from io import StringIO
+import io
+import collections
+import functools
+import importlib
+import threading
+import traceback
+import concurrent.futures
 from contextlib import redirect_stdout, redirect_stderr
-from typing import List, Any, Callable, Dict, Optional
+from typing import List, Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 
 # --- Add project root to sys.path ---
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-# --- Import Brain Command Handlers and Core Components ---
+# --- Import Brain Core Components ---
+# Command handler modules are imported lazily (see BRAIN_COMMAND_HANDLERS) so commands
+# the demo never runs are never loaded.
 try:
     from brain import __version__ as brain_version
-    # Import all command handlers
-    from brain.commands.brain_init import handle_brain_init
-    from brain.commands.add_brain import handle_add_brain
-    from brain.commands.add_neuron import handle_add_neuron
-    from brain.commands.remove_neuron import handle_remove_neuron
-    from brain.commands.sync import handle_sync
-    from brain.commands.export import handle_export
-    from brain.commands.list import handle_list
-    from brain.commands.pull import handle_pull # Will still use subprocess for underlying git pull
-    from brain.commands.push import handle_push # Will still use subprocess for underlying git push
-    from brain.commands.status import handle_status # Will still use subprocess for underlying git status
-    from brain.commands.clone import handle_clone # Will still use subprocess for underlying git clone
-    from brain.commands.checkout import handle_checkout # Will still use subprocess for underlying git checkout
-    from brain.commands.init import handle_init # Will still use subprocess for underlying git init
-
 except ImportError as e:
     print(f"❌ ERROR: Could not import 'brain' modules from '{PROJECT_ROOT}'. Trace: {e}")
     sys.exit(1)
 
+# --- Optional libgit2 Bindings ---
+# When pygit2 is installed, the demo's setup git work (init/add/commit/log) runs
+# in-process instead of spawning a git executable per command.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 # --- Configuration ---
 DEMO_DIR_NAME = "brain_demo_direct_calls"
 BRAIN_REPO_NAME = "local_brain_repo_direct"
 CONSUMER_ALPHA_NAME = "project_alpha_direct"
 CONSUMER_BETA_NAME = "project_beta_direct"
 INITIAL_BRANCH_NAME = "main"
+CAPTURE_TAIL_MAXLEN = 256 # Number of most recent handler output chunks kept by TeeCapture
+# Route handler output through TeeCapture only when requested (BRAIN_DEMO_CAPTURE=1) or on CI,
+# where the tail of a failed handler's output is repeated after it. Otherwise handlers write
+# straight to the real stdout/stderr, tracebacks included.
+CAPTURE_HANDLER_OUTPUT = os.environ.get("BRAIN_DEMO_CAPTURE") == "1" or bool(os.environ.get("CI"))
+# Set BRAIN_DEMO_VERBOSE=0 to skip the per-command "Running (git)" log lines.
+LOG_VERBOSE = os.environ.get("BRAIN_DEMO_VERBOSE", "1") != "0"
+# Handler errors reported as a one-line message; anything else gets a full traceback.
+EXPECTED_EXC = (FileNotFoundError, ValueError)
+
+# --- Brain Repository Sample Content ---
+# Kept as bytes so they are written as-is, with no string building or encoding per run.
+BRAIN_SAMPLE_FILES: Tuple[Tuple[str, bytes], ...] = (
+    ("core_logic/utils.py", b"# Brain utils v1\ndef greet(): pass\n"),
+    ("core_logic/constants.py", b"# Brain constants v1\nVERSION='1.0b'\n"),
+    ("shared_assets/logo.txt", b"BRAIN_LOGO_V1_DIRECT\n"),
+    ("shared_assets/styles/main.css", b"/* Brain CSS v1 */\n"),
+)
+# Demo .brain file, overriding the one written by brain-init with a specific EXPORT section.
+BRAIN_CONFIG_BYTES: bytes = (b"[BRAIN]\nID = my_local_brain\nDESCRIPTION = Demo local brain (direct)\n\n"
+                             b"[EXPORT]\ncore_logic/utils.py = readonly\ncore_logic/constants.py = readwrite\n"
+                             b"shared_assets/* = readonly\n").strip()
 
 # --- Command Handler Mapping for "Virtual Shell" ---
-# Maps command string to the handler function
-BRAIN_COMMAND_HANDLERS: Dict[str, Callable[[List[str]], int]] = {
-    'brain-init': handle_brain_init,
-    'add-brain': handle_add_brain,
-    'add-neuron': handle_add_neuron,
-    'remove-neuron': handle_remove_neuron,
-    'sync': handle_sync,
-    'export': handle_export,
-    'list': handle_list,
+# Maps command string to the handler's 'module:function' path. Entries are resolved
+# on first use and replaced by the handler function itself.
+BRAIN_COMMAND_HANDLERS: Dict[str, Union[str, Callable[[List[str]], int]]] = {
+    'brain-init': 'brain.commands.brain_init:handle_brain_init',
+    'add-brain': 'brain.commands.add_brain:handle_add_brain',
+    'add-neuron': 'brain.commands.add_neuron:handle_add_neuron',
+    'remove-neuron': 'brain.commands.remove_neuron:handle_remove_neuron',
+    'sync': 'brain.commands.sync:handle_sync',
+    'export': 'brain.commands.export:handle_export',
+    'list': 'brain.commands.list:handle_list',
     # Commands that primarily wrap git operations will still use subprocess
     # but their 'brain' specific logic (if any) is part of these handlers.
-    'pull': handle_pull,
-    'push': handle_push,
-    'status': handle_status,
-    'clone': handle_clone,
-    'checkout': handle_checkout,
-    'init': handle_init,
+    'pull': 'brain.commands.pull:handle_pull', # Will still use subprocess for underlying git pull
+    'push': 'brain.commands.push:handle_push', # Will still use subprocess for underlying git push
+    'status': 'brain.commands.status:handle_status', # Will still use subprocess for underlying git status
+    'clone': 'brain.commands.clone:handle_clone', # Will still use subprocess for underlying git clone
+    'checkout': 'brain.commands.checkout:handle_checkout', # Will still use subprocess for underlying git checkout
+    'init': 'brain.commands.init:handle_init', # Will still use subprocess for underlying git init
 }
 
+# --- Runtime State ---
+# Parent directories already created during this run, so repeated file writes
+# into the same folder skip the redundant mkdir probe.
+_CREATED_PARENT_DIRS: Set[pathlib.Path] = set()
+# In-process git sessions keyed by repository path (only used when pygit2 is available).
+_GIT_SESSIONS: Dict[pathlib.Path, "GitSession"] = {}
+# Serializes handler calls, which chdir and redirect stdout/stderr process-wide.
+_HANDLER_CWD_LOCK = threading.Lock()
+# Per-thread console buffer (.buffer) used by ThreadBufferedStream while work runs concurrently.
+_THREAD_OUTPUT = threading.local()
+# String form of the few long-lived repository paths passed as cwd to git.
+_path_str = functools.lru_cache(maxsize=32)(str)
+# Environment passed to every git subprocess, copied once at import instead of per call.
+_GIT_ENV: Dict[str, str] = os.environ.copy()
+
 # --- Helper Functions ---
 def print_header(message: str):
     """
@@ -103,6 +143,7 @@ def print_captured_output(stdout_val: str, stderr_val: str, context: str = "dire
     """
     Description:
         Prints captured stdout and stderr values with appropriate headers.
+        Whitespace-only values are not printed.
     
     Parameters:
         stdout_val (str): The captured standard output.
@@ -112,15 +153,175 @@ def print_captured_output(stdout_val: str, stderr_val: str, context: str = "dire
     Returns:
         None
     """
-    if stdout_val: print(f"\n--- STDOUT ({context}) ---\n{stdout_val.strip()}\n-------------------------")
-    if stderr_val: print(f"\n--- STDERR ({context}) ---\n{stderr_val.strip()}\n-------------------------")
+    # Whitespace-only output is skipped; otherwise only a single trailing newline is sliced off
+    # instead of copying the whole string through .strip().
+    for label, value in (("STDOUT", stdout_val), ("STDERR", stderr_val)):
+        if not value or value.isspace(): continue
+        end = -1 if value.endswith("\n") else None
+        sys.stdout.write(f"\n--- {label} ({context}) ---\n{value[:end]}\n-------------------------\n")
+
+
+class TeeCapture(io.TextIOBase):
+    """
+    Description:
+        Text stream that forwards every write straight to a real stream while keeping
+        a bounded tail of what was written. Output crosses memory once, instead of being
+        buffered whole in a StringIO and printed again afterwards.
+
+    Parameters:
+        stream (io.TextIOBase): The real stream writes are forwarded to.
+        maxlen (Optional[int]): Maximum number of written chunks kept for getvalue(). Default is CAPTURE_TAIL_MAXLEN.
+    """
+
+    def __init__(self, stream, maxlen: Optional[int] = CAPTURE_TAIL_MAXLEN):
+        super().__init__()
+        self._stream = stream
+        self._tail: "collections.deque[str]" = collections.deque(maxlen=maxlen)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        self._stream.write(s)
+        self._tail.append(s)
+        return len(s)
+
+    def flush(self):
+        self._stream.flush()
+
+    def getvalue(self) -> str:
+        """
+        Description:
+            Returns the retained tail of the written output.
+
+        Parameters:
+            None
+
+        Returns:
+            value (str): The most recent output chunks joined together.
+        """
+        return "".join(self._tail)
+
+
+class ThreadBufferedStream(io.TextIOBase):
+    """
+    Description:
+        Text stream installed as sys.stdout/sys.stderr while setups run concurrently.
+        Writes from a thread that has a buffer set in _THREAD_OUTPUT go to that buffer,
+        so each setup's console output can be printed as one block afterwards; writes
+        from any other thread go straight to the real stream.
+
+    Parameters:
+        stream (io.TextIOBase): The real stream used by threads without a buffer.
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        buffer = getattr(_THREAD_OUTPUT, "buffer", None)
+        (buffer if buffer is not None else self._stream).write(s)
+        return len(s)
+
+    def flush(self):
+        if getattr(_THREAD_OUTPUT, "buffer", None) is None:
+            self._stream.flush()
+
+
+def call_with_buffered_output(buffer: io.StringIO, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Description:
+        Calls func with the current thread's console output (stdout and stderr, including
+        git subprocess output) collected into `buffer`. Only takes effect while
+        ThreadBufferedStream is installed as sys.stdout/sys.stderr.
+
+    Parameters:
+        buffer (io.StringIO): Receives everything the call prints.
+        func (Callable[..., Any]): The function to call.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        result (Any): The return value of func.
+    """
+    _THREAD_OUTPUT.buffer = buffer
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _THREAD_OUTPUT.buffer = None
+
+
+class _ChdirLock:
+    """
+    Description:
+        Context manager that holds _HANDLER_CWD_LOCK and switches the process working
+        directory to `cwd` for the duration of the block, restoring it on exit.
+        Only wraps handler calls, since brain handlers resolve their files against os.getcwd().
+
+    Parameters:
+        cwd (pathlib.Path): The working directory to switch to.
+    """
+
+    def __init__(self, cwd: pathlib.Path):
+        self.cwd = cwd
+        self._original_cwd: Optional[str] = None
+
+    def __enter__(self):
+        _HANDLER_CWD_LOCK.acquire()
+        try:
+            self._original_cwd = os.getcwd()
+            os.chdir(str(self.cwd))
+        except BaseException:
+            _HANDLER_CWD_LOCK.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        try:
+            os.chdir(self._original_cwd)
+        finally:
+            _HANDLER_CWD_LOCK.release()
+        return False
+
+
+def resolve_brain_command_handler(command_name: str) -> Optional[Callable[[List[str]], int]]:
+    """
+    Description:
+        Resolves the handler function for a brain command, importing its module on first
+        use and caching the function back into BRAIN_COMMAND_HANDLERS.
+
+    Parameters:
+        command_name (str): The name of the brain command.
+
+    Returns:
+        handler_func (Optional[Callable[[List[str]], int]]): The handler function, or None if the command is unknown.
+    """
+    handler = BRAIN_COMMAND_HANDLERS.get(command_name)
+    if isinstance(handler, str):
+        module_name, func_name = handler.split(":")
+        handler = getattr(importlib.import_module(module_name), func_name)
+        BRAIN_COMMAND_HANDLERS[command_name] = handler
+    return handler
 
 
 def execute_brain_command_directly(command_name: str, args_list: List[str], cwd: pathlib.Path) -> Any:
     """
     Description:
         Executes a brain command by directly calling its handler function.
-        Captures stdout/stderr and return code.
+        Streams stdout/stderr through TeeCapture when CAPTURE_HANDLER_OUTPUT is set
+        (otherwise the handler writes to the real streams) and returns the handler's return code.
+        When captured output belongs to a failed call (non-zero code or exception), its
+        retained tail is printed again after the call so the failure context is grouped.
+
+        Thread safety: brain handlers resolve '.neurons'/'.brain' against the process-wide
+        working directory, and stdout/stderr redirection is process-wide too. Both are only
+        touched inside _ChdirLock, so at most one handler runs at a time;
+        callers on other threads must pass explicit paths (e.g. cwd= for git) and never
+        rely on os.getcwd().
     
     Parameters:
         command_name (str): The name of the brain command to execute.
@@ -130,95 +331,267 @@ def execute_brain_command_directly(command_name: str, args_list: List[str], cwd:
     Returns:
         result (Any): The return value from the command handler function or error code.
     """
+    _APPEND_BATCHER.flush() # Handlers read the working tree, so pending appends must land first
     full_command_str_for_log = f"brain {command_name} {' '.join(args_list)}"
     print(f"\n👉 Executing (direct) in '{cwd.name}': $ {full_command_str_for_log}")
 
-    original_cwd = os.getcwd()
-    os.chdir(str(cwd))
-
     # --------------------------------------------------------------
     # STEP 1: Get the handler function for the specified command.
     # --------------------------------------------------------------
-    handler_func = BRAIN_COMMAND_HANDLERS.get(command_name)
+    try:
+        handler_func = resolve_brain_command_handler(command_name)
+    except ImportError as e_import:
+        print(f"❌ Demo Script Error: Could not import handler for brain command '{command_name}': {e_import}")
+        return None
     if not handler_func:
         stderr_val = f"❌ Demo Script Error: No direct handler found for brain command '{command_name}'."
         print(stderr_val)
-        os.chdir(original_cwd)
         return None # Or raise an error specific to the demo script
 
     # --------------------------------------------------------------
     # STEP 2: Execute the handler function and capture its output.
     # --------------------------------------------------------------
-    stdout_capture = StringIO()
-    stderr_capture = StringIO()
     result = None
 
-    try:
-        # Capture stdout/stderr from direct handler calls for better inspection
-        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            result = handler_func(args_list)
-    except SystemExit as e:  # Argparse often raises SystemExit
-        # ===============
-        # Sub step 2.1: Handle SystemExit exceptions raised by argparse.
-        # ===============
-        # The handler's internal argparse might print to stderr_capture already
-        if type(e.code) is int:
-            result = e.code
-        elif e.code is None: # SystemExit() or SystemExit(None) typically means success (0) or error (1) depending on context
-            result = 0 # Assuming SystemExit() without code is often success or handled by argparse's output
-        else: # Non-integer, non-None code (e.g. a string message printed by argparse)
-            result = 1 # Default to error
-    except Exception as e_handler:
-        # ===============
-        # Sub step 2.2: Handle any other exceptions.
-        # ===============
-        # Ensure full traceback for unexpected exceptions in handlers is captured and reported
-        stderr_capture.write(f"❌ EXCEPTION in handler for '{command_name}': {type(e_handler).__name__}: {e_handler}\n")
-        import traceback
-        traceback.print_exc(file=stderr_capture)
-        result = 1 # Indicate error
-    finally:
-        os.chdir(original_cwd)
+    with _ChdirLock(cwd):
+        if CAPTURE_HANDLER_OUTPUT:
+            stdout_capture, stderr_capture = TeeCapture(sys.stdout), TeeCapture(sys.stderr)
+        else:
+            stdout_capture, stderr_capture = sys.stdout, sys.stderr
+
+        try:
+            if CAPTURE_HANDLER_OUTPUT:
+                # Stream stdout/stderr from direct handler calls, keeping a tail for inspection
+                with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+                    result = handler_func(args_list)
+            else:
+                result = handler_func(args_list)
+        except SystemExit as e:  # Argparse often raises SystemExit
+            # ===============
+            # Sub step 2.1: Handle SystemExit exceptions raised by argparse.
+            # ===============
+            # The handler's internal argparse might print to stderr_capture already
+            if type(e.code) is int:
+                result = e.code
+            elif e.code is None: # SystemExit() or SystemExit(None) typically means success (0) or error (1) depending on context
+                result = 0 # Assuming SystemExit() without code is often success or handled by argparse's output
+            else: # Non-integer, non-None code (e.g. a string message printed by argparse)
+                result = 1 # Default to error
+        except Exception as e_handler:
+            # ===============
+            # Sub step 2.2: Handle any other exceptions.
+            # ===============
+            # Ensure full traceback for unexpected exceptions in handlers is captured and reported
+            stderr_capture.write(f"❌ EXCEPTION in handler for '{command_name}': {type(e_handler).__name__}: {e_handler}\n")
+            if not isinstance(e_handler, EXPECTED_EXC):
+                traceback.print_exc(file=stderr_capture)
+            result = 1 # Indicate error
 
     # --------------------------------------------------------------
-    # STEP 3: Print the captured output.
+    # STEP 3: On failure, repeat the captured output tail for the log.
     # --------------------------------------------------------------
-    stdout_val = stdout_capture.getvalue()
-    stderr_val = stderr_capture.getvalue()
-    print_captured_output(stdout_val, stderr_val, f"brain {command_name}")
+    if CAPTURE_HANDLER_OUTPUT and isinstance(result, int) and result != 0:
+        print_captured_output(stdout_capture.getvalue(), stderr_capture.getvalue(),
+                              f"tail of failed 'brain {command_name}', exit code {result}")
 
     return result
 
 
-def run_git_command_subprocess(cmd_list: List[str], cwd: pathlib.Path, check_return_code: bool = True) -> Any:
+class GitSession:
+    """
+    Description:
+        In-process git session for one repository, backed by pygit2 (libgit2).
+        Handles the plumbing the demo needs for setup (init, add, commit, log -n 1)
+        without spawning a git process. Any other verb is left to subprocess.
+
+    Parameters:
+        cwd (pathlib.Path): The repository working directory.
+    """
+
+    def __init__(self, cwd: pathlib.Path):
+        self.cwd = cwd
+        self._repo = None
+
+    @staticmethod
+    def supports(cmd_list: List[str]) -> bool:
+        """
+        Description:
+            Checks whether a git command can be served in-process.
+
+        Parameters:
+            cmd_list (List[str]): The git command and its arguments as a list.
+
+        Returns:
+            supported (bool): True if the command is handled by GitSession.
+        """
+        args = cmd_list[1:]
+        if pygit2 is None or not args:
+            return False
+        if args[0] == "init":
+            return len(args) == 3 and args[1] == "-b"
+        if args[0] == "add":
+            return len(args) >= 2
+        if args[0] == "commit":
+            return len(args) == 3 and args[1] in ("-m", "-am")
+        if args[0] == "log":
+            return args[1:] == ["-n", "1", "--pretty=oneline"]
+        return False
+
+    @property
+    def repo(self):
+        """
+        Description:
+            Lazily opens the pygit2 repository for this session.
+
+        Parameters:
+            None
+
+        Returns:
+            repo (pygit2.Repository): The opened repository.
+        """
+        if self._repo is None:
+            self._repo = pygit2.Repository(str(self.cwd))
+        return self._repo
+
+    def _signature(self):
+        """
+        Description:
+            Builds the commit signature, honouring GIT_AUTHOR_NAME/GIT_AUTHOR_EMAIL like the git CLI.
+
+        Parameters:
+            None
+
+        Returns:
+            signature (pygit2.Signature): The author/committer signature.
+        """
+        name, email = os.environ.get("GIT_AUTHOR_NAME"), os.environ.get("GIT_AUTHOR_EMAIL")
+        if name and email:
+            return pygit2.Signature(name, email)
+        return self.repo.default_signature
+
+    def run(self, cmd_list: List[str]) -> subprocess.CompletedProcess:
+        """
+        Description:
+            Executes a supported git command in-process.
+
+        Parameters:
+            cmd_list (List[str]): The git command and its arguments as a list.
+
+        Returns:
+            process (subprocess.CompletedProcess): A completed-process object mirroring the git CLI result.
+        """
+        verb, args = cmd_list[1], cmd_list[2:]
+        stdout = ""
+
+        if verb == "init":
+            self._repo = pygit2.init_repository(str(self.cwd), initial_head=args[1])
+            stdout = f"Initialized empty Git repository in {self.cwd / '.git'}/\n"
+
+        elif verb == "add":
+            index = self.repo.index
+            index.read() # Pick up index changes made by git subprocesses/handlers
+            for path_spec in args:
+                if path_spec == ".": index.add_all()
+                else: index.add(path_spec)
+            index.write()
+
+        elif verb == "commit":
+            repo, index = self.repo, self.repo.index
+            index.read() # Pick up index changes made by git subprocesses/handlers
+            if args[0] == "-am": # Stage modifications/deletions of tracked files only
+                for path, flags in repo.status().items():
+                    if flags & pygit2.GIT_STATUS_WT_DELETED: index.remove(path)
+                    elif flags & pygit2.GIT_STATUS_WT_MODIFIED: index.add(path)
+                index.write()
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            signature = self._signature()
+            commit_id = repo.create_commit("HEAD", signature, signature, args[1], index.write_tree(), parents)
+            stdout = f"[{repo.head.shorthand} {str(commit_id)[:7]}] {args[1]}\n"
+
+        elif verb == "log":
+            head_commit = self.repo[self.repo.head.target]
+            stdout = f"{head_commit.id} {head_commit.message.splitlines()[0]}\n"
+
+        return subprocess.CompletedProcess(cmd_list, 0, stdout=stdout, stderr="")
+
+    def close(self):
+        """
+        Description:
+            Releases the underlying libgit2 repository handle.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self._repo is not None:
+            self._repo.free()
+            self._repo = None
+
+
+def close_git_sessions():
+    """
+    Description:
+        Closes and forgets all cached in-process git sessions.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    for session in _GIT_SESSIONS.values():
+        session.close()
+    _GIT_SESSIONS.clear()
+
+
+def run_git_command_subprocess(cmd_list: List[str], cwd: pathlib.Path, check_return_code: bool = True, capture: bool = True) -> Any:
     """
     Description:
         Runs git commands using subprocess, with proper output capturing and error handling.
+        Commands supported by GitSession are served in-process when pygit2 is installed.
     
     Parameters:
         cmd_list (List[str]): The git command and its arguments as a list.
         cwd (pathlib.Path): The current working directory to execute the command in.
         check_return_code (bool): Whether to check the return code and raise an exception on non-zero exit. Default is True.
+        capture (bool): Whether to capture git's output and re-print it. When False, git writes straight to the inherited stdout/stderr and the returned process has no output attached. Default is True.
 
     Returns:
-        process (subprocess.CompletedProcess): The completed process object from subprocess.run.
+        process (subprocess.CompletedProcess): The completed process object from subprocess.run (or GitSession.run).
     """
-    cmd_str = " ".join(str(c) for c in cmd_list)
-    print(f"\n👉 Running (git) in '{cwd.name}': $ {cmd_str}")
-    if True: # Forcing subprocess as per original script logic for git
-        # Fall back to subprocess if GitPython is not available
-        print("Note: Using subprocess for git operations (GitPython not available)")
+    _APPEND_BATCHER.flush() # git reads the working tree, so pending appends must land first
+    # The command string is only built when it is logged or reported in an error
+    if LOG_VERBOSE: print(f"\n👉 Running (git) in '{cwd.name}': $ {' '.join(map(str, cmd_list))}")
+    if GitSession.supports(cmd_list):
+        # Serve the command in-process through libgit2 when possible
+        session = _GIT_SESSIONS.setdefault(cwd, GitSession(cwd))
+        try:
+            process = session.run(cmd_list)
+            print_captured_output(process.stdout, process.stderr, "git (pygit2)")
+            return process
+        except (pygit2.GitError, KeyError, ValueError) as e_session:
+            print(f"Note: pygit2 could not run '{' '.join(map(str, cmd_list))}' ({e_session}); falling back to subprocess")
+    if True: # Everything else goes through the git executable
+        # Fall back to subprocess if pygit2 is not available or the command is not supported
+        print("Note: Using subprocess for git operations (pygit2 not available or command not supported)")
         try:
             # --------------------------------------------------------------
             # STEP 1: Execute the git command using subprocess.
             # --------------------------------------------------------------
+            # A thread whose output is buffered must capture, since git would write to the real fds
+            if not capture and getattr(_THREAD_OUTPUT, "buffer", None) is None:
+                # Let git write to the inherited fds; flush first so our own log lines stay in order
+                sys.stdout.flush(); sys.stderr.flush()
+                return subprocess.run(cmd_list, cwd=_path_str(cwd), check=check_return_code, env=_GIT_ENV)
             process = subprocess.run(
                 cmd_list, # Should start with "git"
-                cwd=str(cwd),
+                cwd=_path_str(cwd),
                 check=check_return_code, # Let it raise CalledProcessError if check is True
                 capture_output=True,
                 text=True,
-                env=os.environ.copy()
+                env=_GIT_ENV
             )
             print_captured_output(process.stdout, process.stderr, "git subprocess")
             return process
@@ -234,13 +607,72 @@ def run_git_command_subprocess(cmd_list: List[str], cwd: pathlib.Path, check_ret
             # --------------------------------------------------------------
             # Output already printed by this point if it failed and check_return_code was True,
             # but good to have a clear error message from the demo script itself.
-            print(f"❌ GIT command '{cmd_str}' failed in '{cwd.name}' with exit code {e.returncode}.")
+            print(f"❌ GIT command '{' '.join(map(str, cmd_list))}' failed in '{cwd.name}' with exit code {e.returncode}.")
             # Output was already printed if this was reached due to check=True.
             # If check=False, the caller needs to handle it.
             raise
 
 
-def create_file_with_content(file_path: pathlib.Path, content: str):
+def _write_manifest(root: pathlib.Path, entries: Sequence[Tuple[str, bytes]]):
+    """
+    Description:
+        Writes a batch of files below `root` in one pass. The unique set of parent
+        directories is created once, deepest first, and each file is written with raw
+        os.open/os.write calls instead of going through pathlib's text layer.
+
+    Parameters:
+        root (pathlib.Path): The directory the relative paths are resolved against.
+        entries (Sequence[Tuple[str, bytes]]): Pairs of (POSIX relative path, file content bytes).
+
+    Returns:
+        None
+    """
+    # --------------------------------------------------------------
+    # STEP 1: Create each needed parent directory exactly once.
+    # --------------------------------------------------------------
+    parents = {root / pathlib.PurePosixPath(rel_path).parent for rel_path, _ in entries}
+    for parent_dir in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+        if parent_dir in _CREATED_PARENT_DIRS: continue
+        os.makedirs(parent_dir, exist_ok=True)
+        # makedirs also created the ancestors, so shallower entries can be skipped
+        _CREATED_PARENT_DIRS.add(parent_dir)
+        _CREATED_PARENT_DIRS.update(parent_dir.parents)
+
+    # --------------------------------------------------------------
+    # STEP 2: Write each file's bytes directly.
+    # --------------------------------------------------------------
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    for rel_path, data in entries:
+        fd = os.open(root / rel_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view: view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _display_rel_path(file_path: pathlib.Path, root: Optional[pathlib.Path] = None) -> str:
+    """
+    Description:
+        Returns the path to show in log lines. With a known `root` this is a plain string
+        prefix strip; otherwise it falls back to the path relative to its grandparent.
+
+    Parameters:
+        file_path (pathlib.Path): The file being reported.
+        root (Optional[pathlib.Path]): The repository root the file lives under, if known.
+
+    Returns:
+        rel_path (str): The display path.
+    """
+    path_str = str(file_path)
+    if root is not None:
+        prefix = str(root) + os.sep
+        return path_str[len(prefix):] if path_str.startswith(prefix) else path_str
+    try: return str(file_path.relative_to(file_path.parent.parent))
+    except ValueError: return path_str
+
+
+def create_file_with_content(file_path: pathlib.Path, content: str, root: Optional[pathlib.Path] = None):
     """
     Description:
         Creates a file at the specified path with the given content.
@@ -249,33 +681,223 @@ def create_file_with_content(file_path: pathlib.Path, content: str):
     Parameters:
         file_path (pathlib.Path): The path where the file should be created.
         content (str): The content to write to the file.
+        root (Optional[pathlib.Path]): The repository root, used to shorten the logged path.
 
     Returns:
         None
     """
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(content, encoding="utf-8")
-    try: rel_path = str(file_path.relative_to(file_path.parent.parent))
-    except ValueError: rel_path = str(file_path)
-    print(f"📄 Created file: {rel_path}")
+    _write_manifest(file_path.parent, [(file_path.name, content.encode("utf-8"))])
+    print(f"📄 Created file: {_display_rel_path(file_path, root)}")
+
 
+class AppendBatcher:
+    """
+    Description:
+        Buffers appends per file so bursts of appends to the same path cost a single
+        open/write/close. Pending bytes are flushed before any git command or brain
+        handler runs (both may read the files), and on context exit.
+    """
 
-def append_to_file(file_path: pathlib.Path, content_to_append: str):
+    def __init__(self):
+        """
+        Description:
+            Initializes an empty batch of pending appends.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._pending: Dict[pathlib.Path, bytearray] = collections.defaultdict(bytearray)
+
+    def add(self, path: pathlib.Path, data: bytes):
+        """
+        Description:
+            Queues bytes to be appended to the given file.
+
+        Parameters:
+            path (pathlib.Path): The file to append to.
+            data (bytes): The bytes to append.
+
+        Returns:
+            None
+        """
+        self._pending[path] += data
+
+    def flush(self):
+        """
+        Description:
+            Writes all pending appends, opening each file once with O_APPEND.
+            A missing file is created (mode 0o644 before umask), as open(path, 'a') would.
+            Bytes are dropped from the batch only once written, so if a write fails the
+            unwritten remainder of that file and every later file stay pending.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        while self._pending:
+            path, data = next(iter(self._pending.items()))
+            fd = os.open(path, flags, 0o644)
+            try:
+                while data:
+                    with memoryview(data) as view:
+                        written = os.write(fd, view)
+                    del data[:written]
+            finally:
+                os.close(fd)
+            del self._pending[path]
+
+    def __enter__(self):
+        """
+        Description:
+            Enters the batching context.
+
+        Parameters:
+            None
+
+        Returns:
+            batcher (AppendBatcher): This batcher.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """
+        Description:
+            Flushes the pending appends when the context exits.
+
+        Parameters:
+            exc_type (Optional[type]): Type of the exception raised in the block, if any.
+            exc_value (Optional[BaseException]): The exception raised in the block, if any.
+            exc_tb (Optional[TracebackType]): Traceback of the exception, if any.
+
+        Returns:
+            suppress (bool): Always False, so exceptions from the block propagate.
+        """
+        self.flush()
+        return False
+
+
+# Shared batcher used by append_to_file; flushed by run_git_command_subprocess and
+# execute_brain_command_directly before they run.
+_APPEND_BATCHER = AppendBatcher()
+
+
+def append_to_file(file_path: pathlib.Path, content_to_append: str, root: Optional[pathlib.Path] = None):
     """
     Description:
         Appends the given content to an existing file.
+        The write is buffered in _APPEND_BATCHER until the next git command or brain handler.
     
     Parameters:
         file_path (pathlib.Path): The path to the file to append to.
         content_to_append (str): The content to append to the file.
+        root (Optional[pathlib.Path]): The repository root, used to shorten the logged path.
+
+    Returns:
+        None
+    """
+    _APPEND_BATCHER.add(file_path, content_to_append.encode("utf-8"))
+    print(f"📝 Appended to file: {_display_rel_path(file_path, root)}")
+
+
+def _fast_rmtree(path: pathlib.Path, ignore_errors: bool = False):
+    """
+    Description:
+        Removes a directory tree with an explicit depth-first stack over os.scandir.
+        Files in each directory are unlinked in inode order (close to on-disk order for
+        the many small git loose objects), and a directory is removed once its children
+        are gone. Anything left behind (busy or read-only entries) is retried through
+        shutil.rmtree.
+
+    Parameters:
+        path (pathlib.Path): The directory tree to remove.
+        ignore_errors (bool): Whether errors from the slow-path retry are ignored. Default is False.
 
     Returns:
         None
     """
-    with open(file_path, "a", encoding="utf-8") as f: f.write(content_to_append)
-    try: rel_path = str(file_path.relative_to(file_path.parent.parent))
-    except ValueError: rel_path = str(file_path)
-    print(f"📝 Appended to file: {rel_path}")
+    # --------------------------------------------------------------
+    # STEP 1: Walk the tree, unlinking files and removing emptied directories.
+    # --------------------------------------------------------------
+    stack = [(str(path), False)]
+    while stack:
+        dir_path, children_removed = stack.pop()
+        if children_removed:
+            try: os.rmdir(dir_path)
+            except OSError: pass # Left for the slow path
+            continue
+        stack.append((dir_path, True))
+        try:
+            with os.scandir(dir_path) as it: entries = list(it)
+        except OSError: continue
+        files = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False): stack.append((entry.path, False))
+            else: files.append(entry)
+        files.sort(key=lambda e: e.inode())
+        for entry in files:
+            try: os.unlink(entry.path)
+            except OSError: pass # Left for the slow path
+
+    # --------------------------------------------------------------
+    # STEP 2: Retry whatever could not be removed on the slow path.
+    # --------------------------------------------------------------
+    if os.path.lexists(path):
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+
+
+def _patch_ini_section(path: pathlib.Path, section: str, updates: Dict[str, str]):
+    """
+    Description:
+        Sets keys in one section of an INI file with a single line scan, leaving every
+        other line untouched. Existing keys are rewritten in place, new keys are added
+        after the section's last key, and a missing section is appended. The file is
+        replaced atomically.
+
+    Parameters:
+        path (pathlib.Path): The INI file to patch.
+        section (str): The section name, without brackets.
+        updates (Dict[str, str]): Keys and values to set in the section.
+
+    Returns:
+        None
+    """
+    # --------------------------------------------------------------
+    # STEP 1: Locate the section and rewrite existing keys in place.
+    # --------------------------------------------------------------
+    with open(path, "r", encoding="utf-8") as f: lines = f.read().splitlines()
+    header = f"[{section}]"
+    pending = dict(updates)
+    section_start = next((i for i, line in enumerate(lines) if line.strip() == header), None)
+
+    if section_start is None:
+        while lines and not lines[-1].strip(): lines.pop()
+        lines += ["", header] + [f"{key} = {value}" for key, value in pending.items()]
+    else:
+        insert_at = section_start + 1
+        for i in range(section_start + 1, len(lines)):
+            stripped = lines[i].strip()
+            if stripped.startswith("["): break # Next section
+            if "=" not in stripped or stripped.startswith(("#", ";")): continue
+            key = stripped.split("=", 1)[0].strip()
+            if key in pending: lines[i] = f"{key} = {pending.pop(key)}"
+            insert_at = i + 1
+        # ===============
+        # Sub step 1.1: Add keys that were not present yet.
+        # ===============
+        lines[insert_at:insert_at] = [f"{key} = {value}" for key, value in pending.items()]
+
+    # --------------------------------------------------------------
+    # STEP 2: Write the patched content atomically.
+    # --------------------------------------------------------------
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f: f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
 
 
 # --- Demo Steps ---
@@ -292,7 +914,8 @@ def setup_demo_environment(base_dir: pathlib.Path) -> pathlib.Path:
     """
     print_header("Setting up Demo Environment")
     demo_dir = base_dir / DEMO_DIR_NAME
-    if demo_dir.exists(): shutil.rmtree(demo_dir)
+    if demo_dir.exists(): _fast_rmtree(demo_dir)
+    _CREATED_PARENT_DIRS.clear() # Any cached directories were just removed
     demo_dir.mkdir(parents=True)
     print(f"✅ Demo directory created: {demo_dir}")
     return demo_dir
@@ -321,16 +944,13 @@ def create_local_brain_repository(demo_dir: pathlib.Path) -> pathlib.Path:
     # --------------------------------------------------------------
     # STEP 2: Initialize git repository.
     # --------------------------------------------------------------
-    run_git_command_subprocess(["git", "init", "-b", INITIAL_BRANCH_NAME], cwd=brain_repo_path)
+    run_git_command_subprocess(["git", "init", "-b", INITIAL_BRANCH_NAME], cwd=brain_repo_path, capture=False)
 
     # --------------------------------------------------------------
     # STEP 3: Create sample files.
     # --------------------------------------------------------------
-    create_file_with_content(brain_repo_path / "core_logic/utils.py", "# Brain utils v1\ndef greet(): pass\n")
-    create_file_with_content(brain_repo_path / "core_logic/constants.py", "# Brain constants v1\nVERSION='1.0b'\n")
-    (brain_repo_path / "shared_assets/styles").mkdir(parents=True, exist_ok=True)
-    create_file_with_content(brain_repo_path / "shared_assets/logo.txt", "BRAIN_LOGO_V1_DIRECT\n")
-    create_file_with_content(brain_repo_path / "shared_assets/styles/main.css", "/* Brain CSS v1 */\n")
+    _write_manifest(brain_repo_path, BRAIN_SAMPLE_FILES)
+    for rel_path, _ in BRAIN_SAMPLE_FILES: print(f"📄 Created file: {rel_path}")
 
     # --------------------------------------------------------------
     # STEP 4: Initialize brain configuration.
@@ -340,17 +960,14 @@ def create_local_brain_repository(demo_dir: pathlib.Path) -> pathlib.Path:
 
     # Overwrite .brain with specific export configuration for the demo
     # This ensures the demo tests specific export functionalities that might not be fully configurable via CLI args of brain-init
-    brain_config_content = ("[BRAIN]\nID = my_local_brain\nDESCRIPTION = Demo local brain (direct)\n\n"
-                            "[EXPORT]\ncore_logic/utils.py = readonly\ncore_logic/constants.py = readwrite\n"
-                            "shared_assets/* = readonly\n")
-    (brain_repo_path / ".brain").write_text(brain_config_content.strip(), encoding="utf-8")
+    _write_manifest(brain_repo_path, [(".brain", BRAIN_CONFIG_BYTES)])
     print(f"⚙️  Manually configured .brain file in {brain_repo_path.name}")
 
     # --------------------------------------------------------------
     # STEP 5: Commit the initial setup.
     # --------------------------------------------------------------
-    run_git_command_subprocess(["git", "add", "."], cwd=brain_repo_path)
-    run_git_command_subprocess(["git", "commit", "-m", f"Initial brain setup (direct calls) on {INITIAL_BRANCH_NAME}"], cwd=brain_repo_path)
+    run_git_command_subprocess(["git", "add", "."], cwd=brain_repo_path, capture=False)
+    run_git_command_subprocess(["git", "commit", "-m", f"Initial brain setup (direct calls) on {INITIAL_BRANCH_NAME}"], cwd=brain_repo_path, capture=False)
     print("✅ Local brain repository initialized and configured.")
     return brain_repo_path
 
@@ -382,7 +999,7 @@ def create_consumer_repository(
     consumer_repo_path.mkdir()
     print(f"🛍️ Consumer repo dir: {consumer_repo_path}")
 
-    run_git_command_subprocess(["git", "init", "-b", INITIAL_BRANCH_NAME], cwd=consumer_repo_path)
+    run_git_command_subprocess(["git", "init", "-b", INITIAL_BRANCH_NAME], cwd=consumer_repo_path, capture=False)
 
     # --------------------------------------------------------------
     # STEP 2: Add the brain to the consumer repository.
@@ -404,20 +1021,15 @@ def create_consumer_repository(
         print_subheader(f"Overriding sync policy in .neurons for {consumer_name}")
         neurons_file_path = consumer_repo_path / ".neurons"
         if neurons_file_path.exists():
-            from configparser import ConfigParser # Local import is fine for a demo script helper
-            parser = ConfigParser(); parser.optionxform = str
-            parser.read(str(neurons_file_path))
-            if not parser.has_section('SYNC_POLICY'): parser.add_section('SYNC_POLICY')
-            for key, value in sync_policy_overrides.items():
-                parser.set('SYNC_POLICY', key.upper(), str(value).lower())
-            with open(neurons_file_path, "w", encoding="utf-8") as f: parser.write(f)
+            _patch_ini_section(neurons_file_path, 'SYNC_POLICY',
+                               {key.upper(): str(value).lower() for key, value in sync_policy_overrides.items()})
             print(f"📝 Updated .neurons for {consumer_name} with: {sync_policy_overrides}")
 
     # --------------------------------------------------------------
     # STEP 5: Commit the initial setup.
     # --------------------------------------------------------------
-    run_git_command_subprocess(["git", "add", "."], cwd=consumer_repo_path)
-    run_git_command_subprocess(["git", "commit", "-m", f"Initial commit: Setup {consumer_name}"], cwd=consumer_repo_path)
+    run_git_command_subprocess(["git", "add", "."], cwd=consumer_repo_path, capture=False)
+    run_git_command_subprocess(["git", "commit", "-m", f"Initial commit: Setup {consumer_name}"], cwd=consumer_repo_path, capture=False)
     print(f"✅ Consumer repository {consumer_name} initialized.")
     return consumer_repo_path
 
@@ -461,10 +1073,10 @@ def demonstrate_workflow(
     # STEP 2: Modify neurons in the brain repository.
     # --------------------------------------------------------------
     print_header("Modifying Neurons in Brain Repository")
-    append_to_file(brain_repo_path / "core_logic/utils.py", "\n# Brain utils v2\ndef farewell(): pass\n")
-    run_git_command_subprocess(["git", "commit", "-am", "Update utils.py in brain (v2)"], cwd=brain_repo_path)
-    append_to_file(brain_repo_path / "shared_assets/styles/main.css", "\n.new { color: blue; } /* v2 */\n")
-    run_git_command_subprocess(["git", "commit", "-am", "Update main.css in brain (v2)"], cwd=brain_repo_path)
+    append_to_file(brain_repo_path / "core_logic/utils.py", "\n# Brain utils v2\ndef farewell(): pass\n", root=brain_repo_path)
+    run_git_command_subprocess(["git", "commit", "-am", "Update utils.py in brain (v2)"], cwd=brain_repo_path, capture=False)
+    append_to_file(brain_repo_path / "shared_assets/styles/main.css", "\n.new { color: blue; } /* v2 */\n", root=brain_repo_path)
+    run_git_command_subprocess(["git", "commit", "-am", "Update main.css in brain (v2)"], cwd=brain_repo_path, capture=False)
 
     # --------------------------------------------------------------
     # STEP 3: Sync changes from brain to consumer repositories.
@@ -481,9 +1093,9 @@ def demonstrate_workflow(
     # STEP 4: Modify a file in consumer and export changes back to brain.
     # --------------------------------------------------------------
     print_header(f"Modifying and Exporting from {CONSUMER_BETA_NAME}")
-    append_to_file(beta_constants_path, "\n# Beta local change\nBETA_VER='1.1'\n")
-    run_git_command_subprocess(["git", "add", str(beta_constants_path.relative_to(consumer_beta_path))], cwd=consumer_beta_path)
-    run_git_command_subprocess(["git", "commit", "-m", "Local mod to constants in Beta"], cwd=consumer_beta_path)
+    append_to_file(beta_constants_path, "\n# Beta local change\nBETA_VER='1.1'\n", root=consumer_beta_path)
+    run_git_command_subprocess(["git", "add", str(beta_constants_path.relative_to(consumer_beta_path))], cwd=consumer_beta_path, capture=False)
+    run_git_command_subprocess(["git", "commit", "-m", "Local mod to constants in Beta"], cwd=consumer_beta_path, capture=False)
     execute_brain_command_directly("export", [str(beta_constants_path.relative_to(consumer_beta_path)), '--force'], cwd=consumer_beta_path)
 
     # --------------------------------------------------------------
@@ -504,10 +1116,10 @@ def demonstrate_workflow(
     alpha_utils_rel_path = str(alpha_utils_path.relative_to(consumer_alpha_path))
     execute_brain_command_directly("remove-neuron", [alpha_utils_rel_path, "--delete"], cwd=consumer_alpha_path)
     if not alpha_utils_path.exists(): print(f"✅ Neuron file {alpha_utils_rel_path} deleted from FS.")
-    run_git_command_subprocess(["git", "add", ".neurons"], cwd=consumer_alpha_path)
+    run_git_command_subprocess(["git", "add", ".neurons"], cwd=consumer_alpha_path, capture=False)
     if not alpha_utils_path.exists(): # If --delete worked
-         run_git_command_subprocess(["git", "rm", alpha_utils_rel_path], cwd=consumer_alpha_path, check_return_code=False) # `git rm` will fail if file not there, so `check_return_code=False`
-    run_git_command_subprocess(["git", "commit", "-m", f"Removed {alpha_utils_rel_path} neuron"], cwd=consumer_alpha_path)
+         run_git_command_subprocess(["git", "rm", alpha_utils_rel_path], cwd=consumer_alpha_path, check_return_code=False, capture=False) # `git rm` will fail if file not there, so `check_return_code=False`
+    run_git_command_subprocess(["git", "commit", "-m", f"Removed {alpha_utils_rel_path} neuron"], cwd=consumer_alpha_path, capture=False)
 
     print_header("🎉 Demo Complete! 🎉")
 
@@ -536,20 +1148,32 @@ def main():
         # --------------------------------------------------------------
         # STEP 2: Create consumer repositories.
         # --------------------------------------------------------------
-        alpha_repo = create_consumer_repository(
-            demo_dir, CONSUMER_ALPHA_NAME, brain_repo,
-            neurons_to_add=[("my_local_brain::core_logic/utils.py::app_code/brain_utils.py", "Core utils")],
-            sync_policy_overrides={"allow_local_modifications": False, "conflict_strategy": "prefer_brain"}
-        ).resolve()
-
-        beta_repo = create_consumer_repository(
-            demo_dir, CONSUMER_BETA_NAME, brain_repo,
-            neurons_to_add=[
-                ("my_local_brain::shared_assets/::assets_from_brain/", "Shared assets dir"),
-                ("my_local_brain::core_logic/constants.py::config/brain_constants.py", "Core constants")
-            ],
-            sync_policy_overrides={"allow_local_modifications": True, "allow_push_to_brain": True, "conflict_strategy": "prefer_brain"}
-        ).resolve()
+        # Both consumers only read from the brain repo and live in separate directories,
+        # so they are set up concurrently; see execute_brain_command_directly for the CWD rules.
+        # Each setup's output is buffered and printed as one block, alpha first, once both finish.
+        alpha_output, beta_output = io.StringIO(), io.StringIO()
+        with redirect_stdout(ThreadBufferedStream(sys.stdout)), redirect_stderr(ThreadBufferedStream(sys.stderr)), \
+                concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            alpha_future = executor.submit(
+                call_with_buffered_output, alpha_output, create_consumer_repository,
+                demo_dir, CONSUMER_ALPHA_NAME, brain_repo,
+                neurons_to_add=[("my_local_brain::core_logic/utils.py::app_code/brain_utils.py", "Core utils")],
+                sync_policy_overrides={"allow_local_modifications": False, "conflict_strategy": "prefer_brain"}
+            )
+            beta_future = executor.submit(
+                call_with_buffered_output, beta_output, create_consumer_repository,
+                demo_dir, CONSUMER_BETA_NAME, brain_repo,
+                neurons_to_add=[
+                    ("my_local_brain::shared_assets/::assets_from_brain/", "Shared assets dir"),
+                    ("my_local_brain::core_logic/constants.py::config/brain_constants.py", "Core constants")
+                ],
+                sync_policy_overrides={"allow_local_modifications": True, "allow_push_to_brain": True, "conflict_strategy": "prefer_brain"}
+            )
+            concurrent.futures.wait([alpha_future, beta_future])
+        sys.stdout.write(alpha_output.getvalue())
+        sys.stdout.write(beta_output.getvalue())
+        alpha_repo = alpha_future.result().resolve()
+        beta_repo = beta_future.result().resolve()
 
         # --------------------------------------------------------------
         # STEP 3: Demonstrate the complete workflow.
@@ -572,13 +1196,17 @@ def main():
         # --------------------------------------------------------------
         # STEP 6: Handle unexpected errors.
         # --------------------------------------------------------------
-        import traceback
         print(f"\n❌ An unexpected error occurred: {type(e).__name__} - {e} ❌"); traceback.print_exc()
     finally:
         # --------------------------------------------------------------
         # STEP 7: Clean up the demo environment.
         # --------------------------------------------------------------
         print_header("Demo Teardown")
+        try:
+            _APPEND_BATCHER.flush()
+        except OSError as e_flush: # Report it, but never mask the error that stopped the demo
+            print(f"❌ Could not write pending file appends during teardown: {e_flush}")
+        close_git_sessions()
         cleanup = ""
         # Default to "no" for cleanup in non-interactive environments to preserve logs/state for CI or automated runs.
         if not sys.stdin.isatty(): print("Non-interactive, defaulting to NO cleanup."); cleanup = "no"
@@ -587,7 +1215,7 @@ def main():
             except EOFError: cleanup = "yes"; print("EOF, defaulting to cleanup.") # Keep 'yes' for EOF if interactive started
         
         if cleanup in ["", "y", "yes"]: # Only cleanup if explicitly 'yes' or empty prompt (which defaults to yes)
-            shutil.rmtree(base_dir / DEMO_DIR_NAME, ignore_errors=True)
+            _fast_rmtree(base_dir / DEMO_DIR_NAME, ignore_errors=True)
             print(f"🗑️ Demo directory '{base_dir / DEMO_DIR_NAME}' removed (or attempt made).")
         else: print(f"ℹ️ Demo directory '{base_dir / DEMO_DIR_NAME}' was not removed.")
 
@@ -1,3 +1,23 @@
+"""
+Brain - Git Extension for Code Sharing Test Suite.
+
+This package contains tests for all components of the Brain extension.
+
+Usage:
+    python run_tests.py               Run the suite serially (accepts unittest.main options).
+    python run_tests.py --jobs N      Run the whole suite's test classes across N worker processes
+                                      (cannot be combined with unittest options).
+"""
+
+import os
+import io
+import sys
+import argparse
+import unittest
+import concurrent.futures
+
+# Add parent directory to path to import brain module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # Init the tests
 from tests.tests_init import *
 
@@ -7,5 +27,89 @@ from tests.test_config import *
 from tests.test_sync import *
 
 
+def _run_test_shard(test_names):
+    """
+    Description:
+        Runs the given tests in the current (worker) process and reports the outcome.
+
+    Parameters:
+        test_names (list): Dotted test names (module.Class.method) to run
+
+    Returns:
+        tuple: (runner output, tests run, failure count, error count)
+    """
+    stream = io.StringIO()
+    suite = unittest.defaultTestLoader.loadTestsFromNames(test_names)
+    result = unittest.TextTestRunner(stream=stream, verbosity=1).run(suite)
+    return stream.getvalue(), result.testsRun, len(result.failures), len(result.errors)
+
+
+def run_parallel(jobs: int) -> bool:
+    """
+    Description:
+        Runs the suite across `jobs` worker processes. Tests are sharded by test class,
+        so class-level fixtures stay within one process, and each worker has its own
+        working directory, which keeps the tests' os.chdir calls independent.
+
+    Parameters:
+        jobs (int): Number of worker processes
+
+    Returns:
+        bool: True if every test passed
+    """
+    # --------------------------------------------------------------
+    # STEP 1: Group test names by class and deal the classes round-robin into shards.
+    # --------------------------------------------------------------
+    suite = unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])
+    by_class = {}
+    stack = [suite]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, unittest.TestSuite): stack.extend(item)
+        else: by_class.setdefault(type(item), []).append(item.id())
+    shards = [[] for _ in range(jobs)]
+    for index, names in enumerate(sorted(by_class.values())):
+        shards[index % jobs].extend(names)
+
+    # --------------------------------------------------------------
+    # STEP 2: Run the shards and report the combined result.
+    # --------------------------------------------------------------
+    total_run = total_failures = total_errors = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        for output, tests_run, failures, errors in executor.map(_run_test_shard, [s for s in shards if s]):
+            if failures or errors: sys.stderr.write(output)
+            total_run += tests_run; total_failures += failures; total_errors += errors
+    print(f"Ran {total_run} tests in {jobs} processes: {total_failures} failures, {total_errors} errors")
+    return not (total_failures or total_errors)
+
+
+def _positive_int(value: str) -> int:
+    """
+    Description:
+        argparse type for --jobs: a whole number of at least 1.
+
+    Parameters:
+        value (str): The raw command-line value
+
+    Returns:
+        int: The parsed number of worker processes
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 if __name__ == '__main__':
-    unittest.main()
+    # Only --jobs is ours; without it, every other argument (and -h) is left to unittest.main
+    parser = argparse.ArgumentParser(usage="%(prog)s [--jobs N | unittest options]", add_help=False)
+    parser.add_argument('--jobs', type=_positive_int, metavar='N', help="Run the test classes across N worker processes")
+    options, remaining = parser.parse_known_args()
+    if options.jobs is not None:
+        if remaining:
+            parser.error(f"--jobs runs the whole suite and cannot be combined with: {' '.join(remaining)}")
+        sys.exit(0 if run_parallel(options.jobs) else 1)
+    unittest.main(argv=[sys.argv[0]] + remaining)
@@ -5,6 +5,9 @@ These tests verify that the brain commands work correctly.
 """
 
 import os
+import contextlib
+import functools
+import shutil
 import tempfile
 import unittest
 from unittest import mock
@@ -23,16 +26,93 @@ from brain.commands.sync import handle_sync
 from brain.commands.list import handle_list
 from brain.commands.init import handle_init 
 
-def run_git_in_path(path: str, args: list, check=True, initial_branch_name="main"):
+try:
+    from contextlib import chdir as working_directory
+except ImportError: # Python < 3.11
+    @contextlib.contextmanager
+    def working_directory(path):
+        """
+        Description:
+            Backport of contextlib.chdir: switches the working directory for the block
+            and restores the previous one afterwards.
+        
+        Parameters:
+            path (str): The directory to switch to
+
+        Returns:
+            None
+        """
+        original_cwd = os.getcwd()
+        os.chdir(path)
+        try:
+            yield
+        finally:
+            os.chdir(original_cwd)
+
+# Put test repositories on RAM-backed /dev/shm when it is usable, unless TMPDIR picks a location.
+_TMP_BASE = '/dev/shm' if not os.environ.get('TMPDIR') and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+# No auto-gc, commit signing or line-ending conversion in test repositories.
+GIT_TEST_COMMAND = ['git', '-c', 'gc.auto=0', '-c', 'commit.gpgsign=false', '-c', 'core.autocrlf=false']
+# Python opens its own fds non-inheritable (PEP 446), so on POSIX the test git processes can skip
+# the close-all-fds pass before exec, which is costly when RLIMIT_NOFILE is high.
+GIT_CLOSE_FDS = os.name != 'posix'
+# Every test git process: no pager, no credential prompts, no optional index-refresh locks,
+# C locale for stable output, and no /etc/gitconfig.
+GIT_TEST_ENV = {**os.environ, 'GIT_PAGER': 'cat', 'PAGER': 'cat', 'GIT_TERMINAL_PROMPT': '0',
+                'GIT_OPTIONAL_LOCKS': '0', 'LC_ALL': 'C', 'GIT_CONFIG_NOSYSTEM': '1'}
+# Global config is only skipped for init; commits still need the user's identity.
+GIT_INIT_ENV = {**GIT_TEST_ENV, 'GIT_CONFIG_GLOBAL': os.devnull, 'GIT_TEMPLATE_DIR': ''}
+
+# Parent of every per-test directory in this module, removed in one pass by tearDownModule.
+_MODULE_TMP = None
+# Cache directories created by _get_repo_templates.
+_TEMPLATE_ROOTS = []
+
+def setUpModule():
+    """
+    Description:
+        Creates the temporary directory that holds every per-test directory of this module.
+    
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    global _MODULE_TMP
+    _MODULE_TMP = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+
+def tearDownModule():
+    """
+    Description:
+        Removes the module's temporary directory, and with it every per-test directory,
+        along with the cached repository templates.
+    
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    _MODULE_TMP.cleanup()
+    # Not left to atexit: run_tests.py --jobs workers exit without running atexit handlers
+    while _TEMPLATE_ROOTS:
+        shutil.rmtree(_TEMPLATE_ROOTS.pop(), ignore_errors=True)
+    _get_repo_templates.cache_clear()
+
+def run_git_in_path(path: str, args: list, check=True, initial_branch_name="main", capture=False):
     """
     Description:
         Executes a git command in the specified path with standardized branch naming.
+        Standard output is discarded unless `capture` is set; standard error is always
+        kept to report failures.
     
     Parameters:
         path (str): The directory path where the git command will be executed
         args (list): List of git command arguments
         check (bool): Whether to raise an exception on command failure
         initial_branch_name (str): The name to use for the initial branch when running git init
+        capture (bool): Whether to capture stdout as text on the result
 
     Returns:
         subprocess.CompletedProcess: Result of the git command execution
@@ -41,26 +121,214 @@ def run_git_in_path(path: str, args: list, check=True, initial_branch_name="main
         # Modern Git might use 'main' by default, but older might use 'master'.
         # To ensure consistency for tests, we can set the initial branch.
         # `git init -b <branch_name>` sets the initial branch name.
-        res = subprocess.run(['git', 'init', '-b', initial_branch_name] + args[1:], cwd=path, check=check, capture_output=True, text=True)
+        # An empty template skips copying the sample hooks, and init needs no user config.
+        cmd = GIT_TEST_COMMAND + ['init', '-b', initial_branch_name, '--template=', '--quiet'] + args[1:]
+        env = GIT_INIT_ENV
     else:
-        res = subprocess.run(['git'] + args, cwd=path, check=check, capture_output=True, text=True)
+        cmd = GIT_TEST_COMMAND + args
+        env = GIT_TEST_ENV
+    res = subprocess.run(cmd, cwd=path, stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                         stderr=subprocess.PIPE, text=True, env=env, close_fds=GIT_CLOSE_FDS)
     if check and res.returncode != 0:
         print(f"Git command failed in setup: {' '.join(args)}")
         print(f"Stdout: {res.stdout}")
         print(f"Stderr: {res.stderr}")
+        raise subprocess.CalledProcessError(res.returncode, cmd, res.stdout, res.stderr)
     return res
 
 
+# Files committed to the brain repository shared by the command tests.
+BRAIN_TEMPLATE_FILES = (
+    ('.brain', b"[BRAIN]\nID = test-brain-base\nDESCRIPTION = Base Test Brain\n\n"
+               b"[EXPORT]\nlibs/utils/strings.py = readonly\nconfig/settings.json = readwrite\n"
+               b"single_file.txt = readonly\ndirectory_neuron/ = readonly\n"),
+    ('libs/utils/strings.py', b"# Brain strings.py\n"),
+    ('config/settings.json', b'{"brain_version": "1.0"}\n'),
+    ('single_file.txt', b'Brain single file content\n'),
+    ('directory_neuron/file_in_dir.txt', b'Content in dir_neuron\n'),
+)
+
+def build_fast_import_stream(branch_name: str, files, message: str) -> bytes:
+    """
+    Description:
+        Builds a `git fast-import` stream that creates a single root commit on
+        `branch_name` containing the given files. The commit uses a fixed test identity
+        and timestamp, so it does not depend on the user's git configuration.
+    
+    Parameters:
+        branch_name (str): The branch the commit is written to
+        files (Iterable[Tuple[str, bytes]]): Pairs of (repository-relative path, file content)
+        message (str): The commit message
+
+    Returns:
+        bytes: The fast-import stream
+    """
+    message_bytes = message.encode('utf-8')
+    parts = [
+        f"commit refs/heads/{branch_name}\n".encode('utf-8'),
+        b"committer Brain Tests <brain-tests@example.com> 1700000000 +0000\n",
+        b"data %d\n" % len(message_bytes), message_bytes, b"\n",
+    ]
+    for rel_path, content in files:
+        parts += [f"M 100644 inline {rel_path}\n".encode('utf-8'), b"data %d\n" % len(content), content, b"\n"]
+    parts.append(b"done\n")
+    return b"".join(parts)
+
+
+class GitBatchClient:
+    """
+    Description:
+        Reads blobs from a repository through one long-lived `git cat-file --batch` process,
+        so repeated object reads in a test do not each pay a git fork/exec.
+    
+    Parameters:
+        repo_path (str): The repository to read objects from
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._process = None
+
+    def get(self, rev: str, path: str):
+        """
+        Description:
+            Returns the content of `path` at `rev`, starting the cat-file process on first use.
+        
+        Parameters:
+            rev (str): The commit-ish to read from (e.g. 'HEAD' or a commit SHA)
+            path (str): The repository-relative path of the blob
+    
+        Returns:
+            bytes: The blob content, or None if the object does not exist
+        """
+        if self._process is None:
+            self._process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=self.repo_path,
+                                             stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=GIT_TEST_ENV)
+        self._process.stdin.write(f"{rev}:{path}\n".encode('utf-8'))
+        self._process.stdin.flush()
+        header = self._process.stdout.readline().split()
+        if len(header) != 3: # '<object> missing' (or ambiguous)
+            return None
+        content = self._process.stdout.read(int(header[2]))
+        self._process.stdout.read(1) # Trailing newline after each object
+        return content
+
+    def close(self):
+        """
+        Description:
+            Closes stdin so the cat-file process exits, then waits for it.
+        
+        Parameters:
+            None
+    
+        Returns:
+            None
+        """
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_repo_templates(initial_branch_name: str) -> str:
+    """
+    Description:
+        Builds the committed brain repository and the empty consumer repository used by
+        TestCommandBase once per test session. The brain files and commit are written with a
+        single `git fast-import`. Each test copies the repositories with shutil.copytree
+        instead of rebuilding them. The cache directory is removed by tearDownModule.
+    
+    Parameters:
+        initial_branch_name (str): The name to use for the initial branch of both repositories
+
+    Returns:
+        str: The cache directory holding the 'brain' and 'consumer' template repositories
+    """
+    template_root = tempfile.mkdtemp(prefix='brain_test_templates_', dir=_TMP_BASE)
+    _TEMPLATE_ROOTS.append(template_root)
+    brain_template = os.path.join(template_root, 'brain')
+    consumer_template = os.path.join(template_root, 'consumer')
+
+    # --------------------------------------------------------------
+    # STEP 1: Initialize and configure the brain repository.
+    # --------------------------------------------------------------
+    os.mkdir(brain_template)
+    run_git_in_path(brain_template, ['init'], initial_branch_name=initial_branch_name)
+    
+    # ===============
+    # Sub step 1.1: Write all brain files and the initial commit in one fast-import stream.
+    # ===============
+    # fast-import writes the blobs, tree, commit and ref directly, like hash-object/mktree/
+    # commit-tree/update-ref would, so no hooks, signing or index refresh run for the commit.
+    stream = build_fast_import_stream(initial_branch_name, BRAIN_TEMPLATE_FILES,
+                                      f'Initial brain setup on branch {initial_branch_name}')
+    subprocess.run(GIT_TEST_COMMAND + ['fast-import', '--quiet'], cwd=brain_template, input=stream, check=True, env=GIT_TEST_ENV, close_fds=GIT_CLOSE_FDS)
+
+    # ===============
+    # Sub step 1.2: Check out the imported commit into the working tree.
+    # ===============
+    run_git_in_path(brain_template, ['reset', '--hard', '--quiet', initial_branch_name])
+
+    # --------------------------------------------------------------
+    # STEP 2: Initialize the empty consumer repository.
+    # --------------------------------------------------------------
+    os.mkdir(consumer_template)
+    run_git_in_path(consumer_template, ['init'], initial_branch_name=initial_branch_name)
+    return template_root
+
+
+def _write_files(root: str, files: dict):
+    """
+    Description:
+        Writes several files below `root` in one pass. Each parent directory is created
+        once, and each file's bytes are written with raw os.open/os.write calls.
+    
+    Parameters:
+        root (str): The directory the relative paths are resolved against.
+        files (dict): Mapping of relative path to file content (bytes).
+
+    Returns:
+        None
+    """
+    for parent_dir in {os.path.dirname(rel_path) for rel_path in files}:
+        if parent_dir:
+            os.makedirs(os.path.join(root, parent_dir), exist_ok=True)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    for rel_path, content in files.items():
+        fd = os.open(os.path.join(root, rel_path), flags, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+
+
+def _populate_brain_fixture(path: str):
+    """
+    Description:
+        Writes the brain test files (BRAIN_TEMPLATE_FILES) below `path` on disk only,
+        without creating a git repository.
+    
+    Parameters:
+        path (str): The directory to write the brain files into
+
+    Returns:
+        None
+    """
+    _write_files(path, dict(BRAIN_TEMPLATE_FILES))
+
+
 class TestCommandBase(unittest.TestCase):
-    """Base class for command tests with shared setup."""
+    """Base class for command tests with shared setup. Subclasses provide the repositories."""
     
     initial_git_branch_name = "main" # Consistent branch name for test repos
 
     def setUp(self):
         """
         Description:
-            Sets up the test environment by creating temporary directories and initializing git repositories.
-            Creates a brain repository with sample files and a consumer repository.
+            Sets up the test environment by creating a temporary test directory and letting
+            the subclass provide the brain and consumer repositories and the brain URL.
         
         Parameters:
             None
@@ -71,67 +339,51 @@ class TestCommandBase(unittest.TestCase):
         # --------------------------------------------------------------
         # STEP 1: Create temporary test directories.
         # --------------------------------------------------------------
-        self.test_dir_obj = tempfile.TemporaryDirectory() 
-        self.test_dir_path = pathlib.Path(self.test_dir_obj.name)
-
-        self.brain_repo_path = self.test_dir_path / 'actual_brain_repo'
-        self.consumer_repo_path = self.test_dir_path / 'actual_consumer_repo'
+        self._test_dir_str = tempfile.mkdtemp(dir=_MODULE_TMP.name) 
+        # Setup works on plain strings; the Path attributes are kept for the tests' assertions
+        self._consumer_str = os.path.join(self._test_dir_str, 'actual_consumer_repo')
+        self.test_dir_path = pathlib.Path(self._test_dir_str)
+        self.consumer_repo_path = pathlib.Path(self._consumer_str)
         
         # --------------------------------------------------------------
-        # STEP 2: Initialize and configure the brain repository.
+        # STEP 2: Create the brain and consumer repositories.
         # --------------------------------------------------------------
-        self.brain_repo_path.mkdir()
-        run_git_in_path(str(self.brain_repo_path), ['init'], initial_branch_name=self.initial_git_branch_name)
-        
-        # Create brain configuration file
-        brain_file_content = (
-            "[BRAIN]\nID = test-brain-base\nDESCRIPTION = Base Test Brain\n\n"
-            "[EXPORT]\nlibs/utils/strings.py = readonly\nconfig/settings.json = readwrite\n"
-            "single_file.txt = readonly\ndirectory_neuron/ = readonly\n"
-        )
-        (self.brain_repo_path / '.brain').write_text(brain_file_content)
-        
-        # ===============
-        # Sub step 2.1: Create test files and directories in the brain repository.
-        # ===============
-        (self.brain_repo_path / 'libs' / 'utils').mkdir(parents=True, exist_ok=True)
-        (self.brain_repo_path / 'libs/utils/strings.py').write_text("# Brain strings.py\n")
-        (self.brain_repo_path / 'config').mkdir(exist_ok=True)
-        (self.brain_repo_path / 'config/settings.json').write_text('{"brain_version": "1.0"}\n')
-        (self.brain_repo_path / 'single_file.txt').write_text('Brain single file content\n')
-        (self.brain_repo_path / 'directory_neuron').mkdir(exist_ok=True)
-        (self.brain_repo_path / 'directory_neuron' / 'file_in_dir.txt').write_text('Content in dir_neuron\n')
-
-        # ===============
-        # Sub step 2.2: Commit the brain repository contents.
-        # ===============
-        run_git_in_path(str(self.brain_repo_path), ['add', '.'])
-        run_git_in_path(str(self.brain_repo_path), ['commit', '-m', f'Initial brain setup on branch {self.initial_git_branch_name}'])
+        self._create_repositories()
 
-        # --------------------------------------------------------------
-        # STEP 3: Initialize the consumer repository and set up working directory.
-        # --------------------------------------------------------------
-        self.consumer_repo_path.mkdir()
-        run_git_in_path(str(self.consumer_repo_path), ['init'], initial_branch_name=self.initial_git_branch_name)
+    def _create_repositories(self):
+        """
+        Description:
+            Creates self.consumer_repo_path and provides self.brain_repo_path and
+            self._brain_url. Implemented by subclasses.
         
-        # Save original working directory and change to consumer repository
-        self.original_cwd = os.getcwd()
-        os.chdir(str(self.consumer_repo_path)) 
+        Parameters:
+            None
+    
+        Returns:
+            None
+        """
+        raise NotImplementedError
     
-    def tearDown(self):
+    def assert_command_called(self, mock_run: mock.Mock, prefix: list, *expected_args: str):
         """
         Description:
-            Cleans up the test environment by restoring the original working directory
-            and removing temporary test directories.
+            Asserts that the mocked subprocess.run was called with a command starting with
+            `prefix` and containing every one of `expected_args`. Stops at the first match.
         
         Parameters:
-            None
+            mock_run (mock.Mock): The subprocess.run mock
+            prefix (list): Leading command elements, e.g. ['git', 'pull']
+            *expected_args (str): Further arguments the matching command must contain
     
         Returns:
             None
         """
-        os.chdir(self.original_cwd)
-        self.test_dir_obj.cleanup()
+        prefix_len = len(prefix)
+        for call in mock_run.call_args_list:
+            cmd = call.args[0]
+            if cmd[:prefix_len] == prefix and all(arg in cmd for arg in expected_args):
+                return
+        self.fail(f"No call starting with {prefix} and containing {list(expected_args)} in {mock_run.call_args_list}")
 
     def _write_neurons_file_to_consumer(self, content: str):
         """
@@ -145,13 +397,14 @@ class TestCommandBase(unittest.TestCase):
         Returns:
             None
         """
-        (self.consumer_repo_path / '.neurons').write_text(content)
+        with open(os.path.join(self._consumer_str, '.neurons'), 'w') as neurons_file: neurons_file.write(content)
 
     def get_brain_url_for_consumer(self) -> str:
         """
         Description:
-            Creates a file:// URL for the brain repository that can be used
-            by the consumer repository for git operations.
+            Returns the file:// URL for the brain repository that can be used
+            by the consumer repository for git operations. Resolved once, when the
+            brain repository is provided.
         
         Parameters:
             None
@@ -159,17 +412,75 @@ class TestCommandBase(unittest.TestCase):
         Returns:
             str: The file URL to the brain repository
         """
+        return self._brain_url
+
+
+class TestCommandBaseReal(TestCommandBase):
+    """
+    Base class for command tests that need working git repositories.
+    The brain repository is the session-cached template itself, shared read-only by
+    every test of the class; only the consumer repository is copied per test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Description:
+            Points the class at the session-cached brain repository, resolves its file://
+            URL once, and opens a GitBatchClient on it for the whole class.
+        
+        Parameters:
+            None
+    
+        Returns:
+            None
+        """
+        super().setUpClass()
+        cls._template_root = _get_repo_templates(cls.initial_git_branch_name)
+        cls._brain_str = os.path.join(cls._template_root, 'brain')
+        cls.brain_repo_path = pathlib.Path(cls._brain_str)
         # Use file:// prefix for local git URLs for robustness with git clone
-        return f"file://{self.brain_repo_path.resolve().as_posix()}"
+        cls._brain_url = "file://" + os.path.realpath(cls._brain_str).replace(os.sep, '/')
+        cls.brain_objects = GitBatchClient(cls._brain_str)
 
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Description:
+            Closes the class's brain GitBatchClient.
+        
+        Parameters:
+            None
+    
+        Returns:
+            None
+        """
+        cls.brain_objects.close()
+        super().tearDownClass()
 
-class TestBrainInitCommand(unittest.TestCase):
-    """Test the brain brain-init command."""
+    def _create_repositories(self):
+        """
+        Description:
+            Copies in the session-cached consumer repository. The brain repository is
+            shared at class level (see setUpClass).
+        
+        Parameters:
+            None
     
-    def setUp(self):
+        Returns:
+            None
+        """
+        shutil.copytree(os.path.join(self._template_root, 'consumer'), self._consumer_str)
+
+
+class TestCommandBaseMocked(TestCommandBase):
+    """Base class for command tests that mock git entirely; no git repository is created."""
+
+    def _create_repositories(self):
         """
         Description:
-            Sets up a test environment with a temporary directory for brain initialization tests.
+            Writes the brain fixture files and an empty consumer directory on disk only,
+            both inside the test's own directory.
         
         Parameters:
             None
@@ -177,16 +488,20 @@ class TestBrainInitCommand(unittest.TestCase):
         Returns:
             None
         """
-        self.test_dir_obj = tempfile.TemporaryDirectory()
-        self.test_dir = pathlib.Path(self.test_dir_obj.name)
-        self.original_cwd = os.getcwd()
-        os.chdir(str(self.test_dir))
+        self._brain_str = os.path.join(self._test_dir_str, 'actual_brain_repo')
+        self.brain_repo_path = pathlib.Path(self._brain_str)
+        self._brain_url = "file://" + os.path.realpath(self._brain_str).replace(os.sep, '/')
+        _populate_brain_fixture(self._brain_str)
+        os.mkdir(self._consumer_str)
+
+
+class TestBrainInitCommand(unittest.TestCase):
+    """Test the brain brain-init command."""
     
-    def tearDown(self):
+    def setUp(self):
         """
         Description:
-            Cleans up the test environment by restoring the original working directory
-            and removing temporary directories.
+            Sets up a test environment with a temporary directory for brain initialization tests.
         
         Parameters:
             None
@@ -194,8 +509,7 @@ class TestBrainInitCommand(unittest.TestCase):
         Returns:
             None
         """
-        os.chdir(self.original_cwd)
-        self.test_dir_obj.cleanup()
+        self.test_dir = pathlib.Path(tempfile.mkdtemp(dir=_MODULE_TMP.name))
     
     def test_brain_init_command(self):
         """
@@ -210,7 +524,8 @@ class TestBrainInitCommand(unittest.TestCase):
             None
         """
         args = ['--id', 'cmd-test-brain', '--description', 'Cmd Test Desc']
-        result = handle_brain_init(args)
+        with working_directory(self.test_dir):
+            result = handle_brain_init(args)
         self.assertEqual(result, 0)
         brain_cfg_path = self.test_dir / '.brain'
         self.assertTrue(brain_cfg_path.exists())
@@ -231,7 +546,8 @@ class TestBrainInitCommand(unittest.TestCase):
             None
         """
         args = ['--id', 'export-brain', '--export', 'src/*.py=readonly', '--export', 'conf=readwrite']
-        result = handle_brain_init(args)
+        with working_directory(self.test_dir):
+            result = handle_brain_init(args)
         self.assertEqual(result, 0)
         content = (self.test_dir / '.brain').read_text()
         self.assertIn('src/*.py = readonly', content)
@@ -250,12 +566,12 @@ class TestBrainInitCommand(unittest.TestCase):
             None
         """
         args = ['--description', 'No ID Test']
-        with self.assertRaises(SystemExit) as cm:
+        with self.assertRaises(SystemExit) as cm, working_directory(self.test_dir):
             handle_brain_init(args)
         self.assertEqual(cm.exception.code, 2)
 
 
-class TestAddBrainCommand(TestCommandBase):
+class TestAddBrainCommand(TestCommandBaseReal):
     def test_add_brain_command(self):
         """
         Description:
@@ -268,9 +584,10 @@ class TestAddBrainCommand(TestCommandBase):
         Returns:
             None
         """
-        brain_url = self.get_brain_url_for_consumer()
+        brain_url = self._brain_url
         args = ['my-local-brain', brain_url, self.initial_git_branch_name]
-        result = handle_add_brain(args)
+        with working_directory(self.consumer_repo_path):
+            result = handle_add_brain(args)
         # If result is 1, print the error message from handle_add_brain (which is captured by test runner)
         self.assertEqual(result, 0, f"handle_add_brain failed with code {result}. Check test output for command's print statements.")
         
@@ -282,7 +599,7 @@ class TestAddBrainCommand(TestCommandBase):
         self.assertIn(f'BRANCH = {self.initial_git_branch_name}', content)
 
 
-class TestAddNeuronCommand(TestCommandBase):
+class TestAddNeuronCommand(TestCommandBaseReal):
     def setUp(self):
         """
         Description:
@@ -296,17 +613,18 @@ class TestAddNeuronCommand(TestCommandBase):
             None
         """
         super().setUp()
-        brain_url = self.get_brain_url_for_consumer()
+        brain_url = self._brain_url
         neurons_content = (
             f"[BRAIN:test-brain-base]\nREMOTE = {brain_url}\nBRANCH = {self.initial_git_branch_name}\n\n[MAP]\n"
         )
         self._write_neurons_file_to_consumer(neurons_content)
 
-    def test_add_neuron_file(self):
+    def test_add_neuron(self):
         """
         Description:
-            Tests that the add-neuron command correctly maps and syncs a single file
-            from the brain repository to the consumer repository.
+            Tests that the add-neuron command correctly maps and syncs a single file and a
+            directory from the brain repository to the consumer repository. Both cases run
+            as subtests on one setup.
         
         Parameters:
             None
@@ -314,36 +632,35 @@ class TestAddNeuronCommand(TestCommandBase):
         Returns:
             None
         """
-        args = [f'test-brain-base::single_file.txt::local_copy/single.txt']
-        result = handle_add_neuron(args)
-        self.assertEqual(result, 0, f"handle_add_neuron (file) failed with code {result}")
-        content = (self.consumer_repo_path / '.neurons').read_text()
-        # Check for the value part which includes the mapping string
-        self.assertTrue(any(f'test-brain-base::single_file.txt::local_copy/single.txt' in line for line in content.splitlines()))
-        
-        neuron_file_path = self.consumer_repo_path / 'local_copy/single.txt'
-        self.assertTrue(neuron_file_path.exists())
-        self.assertIn('Brain single file content', neuron_file_path.read_text())
+        # --------------------------------------------------------------
+        # STEP 1: Add a single file neuron.
+        # --------------------------------------------------------------
+        with self.subTest(neuron='file'):
+            args = [f'test-brain-base::single_file.txt::local_copy/single.txt']
+            with working_directory(self.consumer_repo_path):
+                result = handle_add_neuron(args)
+            self.assertEqual(result, 0, f"handle_add_neuron (file) failed with code {result}")
+            content = (self.consumer_repo_path / '.neurons').read_text()
+            # Check for the value part which includes the mapping string
+            self.assertTrue(any(f'test-brain-base::single_file.txt::local_copy/single.txt' in line for line in content.splitlines()))
+            
+            neuron_file_path = self.consumer_repo_path / 'local_copy/single.txt'
+            self.assertTrue(neuron_file_path.exists())
+            self.assertIn('Brain single file content', neuron_file_path.read_text())
+            self.assertEqual(neuron_file_path.read_bytes(), self.brain_objects.get('HEAD', 'single_file.txt'))
 
-    def test_add_neuron_directory(self):
-        """
-        Description:
-            Tests that the add-neuron command correctly maps and syncs a directory
-            from the brain repository to the consumer repository.
-        
-        Parameters:
-            None
-    
-        Returns:
-            None
-        """
-        args = [f'test-brain-base::directory_neuron/::local_dir_neuron/']
-        result = handle_add_neuron(args)
-        self.assertEqual(result, 0, f"handle_add_neuron (directory) failed with code {result}")
-        self.assertTrue((self.consumer_repo_path / 'local_dir_neuron' / 'file_in_dir.txt').exists())
+        # --------------------------------------------------------------
+        # STEP 2: Add a directory neuron.
+        # --------------------------------------------------------------
+        with self.subTest(neuron='directory'):
+            args = [f'test-brain-base::directory_neuron/::local_dir_neuron/']
+            with working_directory(self.consumer_repo_path):
+                result = handle_add_neuron(args)
+            self.assertEqual(result, 0, f"handle_add_neuron (directory) failed with code {result}")
+            self.assertTrue((self.consumer_repo_path / 'local_dir_neuron' / 'file_in_dir.txt').exists())
 
 
-class TestRemoveNeuronCommand(TestCommandBase):
+class TestRemoveNeuronCommand(TestCommandBaseReal):
     def setUp(self):
         """
         Description:
@@ -357,7 +674,7 @@ class TestRemoveNeuronCommand(TestCommandBase):
             None
         """
         super().setUp()
-        brain_url = self.get_brain_url_for_consumer()
+        brain_url = self._brain_url
         neurons_content = (
             f"[BRAIN:test-brain-base]\nREMOTE = {brain_url}\nBRANCH = {self.initial_git_branch_name}\n\n"
             "[MAP]\n"
@@ -366,15 +683,16 @@ class TestRemoveNeuronCommand(TestCommandBase):
         )
         self._write_neurons_file_to_consumer(neurons_content)
         # Ensure files exist to be removed/kept
-        (self.consumer_repo_path / 'consumer_single.txt').write_text("content to remove")
-        (self.consumer_repo_path / 'consumer_strings.py').write_text("content to keep")
+        for file_name, content in (('consumer_single.txt', "content to remove"), ('consumer_strings.py', "content to keep")):
+            with open(os.path.join(self._consumer_str, file_name), 'w') as consumer_file: consumer_file.write(content)
 
 
     def test_remove_neuron(self):
         """
         Description:
-            Tests that the remove-neuron command correctly removes a mapping from
-            the .neurons file without deleting the actual file.
+            Tests that the remove-neuron command correctly removes a mapping from the
+            .neurons file, keeping the actual file by default and deleting it when the
+            --delete flag is provided. Both cases run as subtests on one setup.
         
         Parameters:
             None
@@ -382,34 +700,32 @@ class TestRemoveNeuronCommand(TestCommandBase):
         Returns:
             None
         """
-        args = ['consumer_single.txt'] 
-        result = handle_remove_neuron(args)
-        self.assertEqual(result, 0)
-        content = (self.consumer_repo_path / '.neurons').read_text()
-        self.assertNotIn('consumer_single.txt', content) 
-        self.assertIn('consumer_strings.py', content)
-        self.assertTrue((self.consumer_repo_path / 'consumer_single.txt').exists())
+        # --------------------------------------------------------------
+        # STEP 1: Remove a mapping and keep its file.
+        # --------------------------------------------------------------
+        with self.subTest(delete=False):
+            args = ['consumer_single.txt'] 
+            with working_directory(self.consumer_repo_path):
+                result = handle_remove_neuron(args)
+            self.assertEqual(result, 0)
+            content = (self.consumer_repo_path / '.neurons').read_text()
+            self.assertNotIn('consumer_single.txt', content) 
+            self.assertIn('consumer_strings.py', content)
+            self.assertTrue((self.consumer_repo_path / 'consumer_single.txt').exists())
 
-    def test_remove_neuron_with_delete(self):
-        """
-        Description:
-            Tests that the remove-neuron command correctly removes a mapping from
-            the .neurons file and deletes the corresponding file when the --delete
-            flag is provided.
-        
-        Parameters:
-            None
-    
-        Returns:
-            None
-        """
-        args = ['consumer_single.txt', '--delete']
-        result = handle_remove_neuron(args)
-        self.assertEqual(result, 0)
-        self.assertFalse((self.consumer_repo_path / 'consumer_single.txt').exists())
+        # --------------------------------------------------------------
+        # STEP 2: Remove the remaining mapping and delete its file.
+        # --------------------------------------------------------------
+        with self.subTest(delete=True):
+            args = ['consumer_strings.py', '--delete']
+            with working_directory(self.consumer_repo_path):
+                result = handle_remove_neuron(args)
+            self.assertEqual(result, 0)
+            self.assertNotIn('consumer_strings.py', (self.consumer_repo_path / '.neurons').read_text())
+            self.assertFalse((self.consumer_repo_path / 'consumer_strings.py').exists())
 
 
-class TestSyncCommand(TestCommandBase):
+class TestSyncCommand(TestCommandBaseReal):
     def setUp(self):
         """
         Description:
@@ -423,7 +739,7 @@ class TestSyncCommand(TestCommandBase):
             None
         """
         super().setUp()
-        brain_url = self.get_brain_url_for_consumer()
+        brain_url = self._brain_url
         neurons_content = (
             f"[BRAIN:test-brain-base]\nREMOTE = {brain_url}\nBRANCH = {self.initial_git_branch_name}\n\n"
             f"[SYNC_POLICY]\nCONFLICT_STRATEGY = prefer_brain\n\n" 
@@ -432,11 +748,12 @@ class TestSyncCommand(TestCommandBase):
         )
         self._write_neurons_file_to_consumer(neurons_content)
 
-    def test_sync_all(self):
+    def test_sync(self):
         """
         Description:
-            Tests that the sync command correctly synchronizes all mapped neurons
-            when no specific neuron is specified.
+            Tests that the sync command synchronizes only the specified neuron when a
+            specific neuron path is provided, and then all mapped neurons when no neuron
+            is specified. Both cases run as subtests on one setup, specific first.
         
         Parameters:
             None
@@ -444,35 +761,37 @@ class TestSyncCommand(TestCommandBase):
         Returns:
             None
         """
-        args = [] 
-        result = handle_sync(args)
-        self.assertEqual(result, 0, f"handle_sync (all) failed with code {result}")
-        self.assertTrue((self.consumer_repo_path / 'synced_code/strings.py').exists())
-        self.assertTrue((self.consumer_repo_path / 'synced_code/settings.json').exists())
+        # --------------------------------------------------------------
+        # STEP 1: Sync one specific neuron.
+        # --------------------------------------------------------------
+        with self.subTest(scope='specific'):
+            args = ['synced_code/strings.py']
+            with working_directory(self.consumer_repo_path):
+                result = handle_sync(args)
+            self.assertEqual(result, 0, f"handle_sync (specific) failed with code {result}")
+            self.assertTrue((self.consumer_repo_path / 'synced_code/strings.py').exists())
+            # Ensure the other mapped neuron was NOT synced
+            self.assertFalse((self.consumer_repo_path / 'synced_code/settings.json').exists())
 
-    def test_sync_specific_neuron(self):
-        """
-        Description:
-            Tests that the sync command correctly synchronizes only the specified
-            neuron when a specific neuron path is provided.
-        
-        Parameters:
-            None
-    
-        Returns:
-            None
-        """
-        args = ['synced_code/strings.py']
-        result = handle_sync(args)
-        self.assertEqual(result, 0, f"handle_sync (specific) failed with code {result}")
-        self.assertTrue((self.consumer_repo_path / 'synced_code/strings.py').exists())
-        # Ensure the other mapped neuron was NOT synced
-        self.assertFalse((self.consumer_repo_path / 'synced_code/settings.json').exists())
+        # --------------------------------------------------------------
+        # STEP 2: Sync all neurons.
+        # --------------------------------------------------------------
+        with self.subTest(scope='all'):
+            args = [] 
+            with working_directory(self.consumer_repo_path):
+                result = handle_sync(args)
+            self.assertEqual(result, 0, f"handle_sync (all) failed with code {result}")
+            self.assertTrue((self.consumer_repo_path / 'synced_code/strings.py').exists())
+            self.assertTrue((self.consumer_repo_path / 'synced_code/settings.json').exists())
+            self.assertEqual((self.consumer_repo_path / 'synced_code/strings.py').read_bytes(),
+                             self.brain_objects.get('HEAD', 'libs/utils/strings.py'))
+            self.assertEqual((self.consumer_repo_path / 'synced_code/settings.json').read_bytes(),
+                             self.brain_objects.get('HEAD', 'config/settings.json'))
 
 
 @mock.patch('brain.commands.pull.sync_all_neurons') 
 @mock.patch('subprocess.run') 
-class TestPullCommand(TestCommandBase):
+class TestPullCommand(TestCommandBaseMocked):
     def test_pull_calls_git_pull_and_sync(self, mock_subprocess_run, mock_sync_all_neurons_in_pull):
         """
         Description:
@@ -492,7 +811,7 @@ class TestPullCommand(TestCommandBase):
         mock_subprocess_run.return_value = mock.Mock(returncode=0, stdout="", stderr="")
         mock_sync_all_neurons_in_pull.return_value = [{'status': 'success'}]
 
-        brain_url = self.get_brain_url_for_consumer()
+        brain_url = self._brain_url
         neurons_content = (
             f"[BRAIN:test-brain-base]\nREMOTE = {brain_url}\nBRANCH = {self.initial_git_branch_name}\n\n"
             f"[SYNC_POLICY]\nAUTO_SYNC_ON_PULL = true\n\n[MAP]\n"
@@ -503,24 +822,25 @@ class TestPullCommand(TestCommandBase):
         # --------------------------------------------------------------
         # STEP 2: Call the pull command and verify results.
         # --------------------------------------------------------------
-        result = handle_pull([])
+        with working_directory(self.consumer_repo_path):
+            result = handle_pull([])
         self.assertEqual(result, 0)
         
         # Check if git pull was called
-        git_pull_called = any(call.args[0][:2] == ['git', 'pull'] for call in mock_subprocess_run.call_args_list)
-        self.assertTrue(git_pull_called, "'git pull' was not called")
+        self.assert_command_called(mock_subprocess_run, ['git', 'pull'])
         
         # Check if sync was called
         mock_sync_all_neurons_in_pull.assert_called_once()
 
 @mock.patch('brain.commands.clone.sync_all_neurons') # Mock sync
 @mock.patch('subprocess.run') # Mock git calls
-class TestCloneCommand(unittest.TestCase):
+class TestCloneCommand(TestCommandBaseMocked):
     def setUp(self):
         """
         Description:
             Sets up a test environment for clone command tests with a source
-            repository containing a .neurons configuration.
+            directory containing a .neurons configuration. git is mocked, so the
+            source is written on disk only.
         
         Parameters:
             None
@@ -528,44 +848,13 @@ class TestCloneCommand(unittest.TestCase):
         Returns:
             None
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create test directory and set up environment.
-        # --------------------------------------------------------------
-        self.test_dir_obj = tempfile.TemporaryDirectory()
-        self.test_dir = pathlib.Path(self.test_dir_obj.name)
-        self.original_cwd = os.getcwd()
-        os.chdir(str(self.test_dir))
-
-        self.initial_git_branch_name = "main" # For this standalone test setup
-
-        # --------------------------------------------------------------
-        # STEP 2: Create and initialize a source repository to clone from.
-        # --------------------------------------------------------------
-        self.source_repo_to_clone = self.test_dir / 'source_for_clone'
+        super().setUp()
+        self.source_repo_to_clone = self.test_dir_path / 'source_for_clone'
         self.source_repo_to_clone.mkdir()
-        run_git_in_path(str(self.source_repo_to_clone), ['init'], initial_branch_name=self.initial_git_branch_name)
         (self.source_repo_to_clone / '.neurons').write_text( 
             "[BRAIN:dummy]\nREMOTE=dummy_url\n\n[MAP]\nd=dummy::s::d\n"
         )
-        (self.source_repo_to_clone / 'a_file.txt').write_text("content") # Add a file to commit
-        run_git_in_path(str(self.source_repo_to_clone), ['add', '.'])
-        run_git_in_path(str(self.source_repo_to_clone), ['commit', '-m', f'init clone source on {self.initial_git_branch_name}'])
-
-
-    def tearDown(self):
-        """
-        Description:
-            Cleans up the test environment by restoring the original working directory
-            and removing temporary directories.
-        
-        Parameters:
-            None
-    
-        Returns:
-            None
-        """
-        os.chdir(self.original_cwd)
-        self.test_dir_obj.cleanup()
+        (self.source_repo_to_clone / 'a_file.txt').write_text("content")
 
     def test_clone_with_neurons_triggers_sync(self, mock_subprocess_run, mock_sync_all_neurons_in_clone):
         """
@@ -618,17 +907,12 @@ class TestCloneCommand(unittest.TestCase):
         # --------------------------------------------------------------
         # STEP 2: Execute the clone command and verify results.
         # --------------------------------------------------------------
-        result = handle_clone([source_repo_url, cloned_dir_name])
+        with working_directory(self.consumer_repo_path):
+            result = handle_clone([source_repo_url, cloned_dir_name])
         self.assertEqual(result, 0)
         
         # Check if git clone was called with correct arguments
-        found_clone_call = any(
-            call.args[0][:2] == ['git', 'clone'] and
-            source_repo_url in call.args[0] and
-            cloned_dir_name in call.args[0]
-            for call in mock_subprocess_run.call_args_list
-        )
-        self.assertTrue(found_clone_call)
+        self.assert_command_called(mock_subprocess_run, ['git', 'clone'], source_repo_url, cloned_dir_name)
         mock_sync_all_neurons_in_clone.assert_called_once()
 
 
@@ -5,210 +5,247 @@ These tests verify that the configuration parser correctly handles
 .brain and .neurons files.
 """
 
+import io
 import os
+import re
 import tempfile
 import unittest
+from unittest import mock
 
 from brain.config import (
+    DEFAULT_SYNC_POLICY as CONFIG_DEFAULT_SYNC_POLICY,
     BrainConfigError, 
     NeuronsConfigError,
+    clear_load_cache,
     load_brain_config, 
+    load_brain_config_stream,
     load_neurons_config,
+    load_neurons_config_stream,
+    map_columns,
     save_brain_config,
     save_neurons_config
 )
 
 
-class TestBrainConfig(unittest.TestCase):
-    """Test loading and parsing .brain configuration files."""
+# Sentinel for keys that must not appear in a loaded configuration.
+_MISSING = object()
+
+# Expected error messages of the invalid cases.
+_MISSING_ID = re.compile(r"Missing required ID field")
+_MISSING_EXPORT = re.compile(r"Missing required \[EXPORT\] section")
+_MISSING_MAP = re.compile(r"Missing required \[MAP\] section")
+_UNKNOWN_BRAIN = re.compile(r"Unknown brain 'unknown_brain'")
+
+# Config contents are encoded once here and fed to the loaders through io.BytesIO.
+_VALID_BRAIN = (
+    "[BRAIN]\n"
+    "ID = test-brain\n" 
+    "DESCRIPTION = Test brain repository\n\n"
+    "[EXPORT]\n"
+    "libs/**/*.py = readonly\n"
+    "config/*.json = readwrite\n\n"
+    "[ACCESS]\n"
+    "user1 = libs/**/*.py, config/*.json\n" 
+    "group_all = *\n\n"
+    "[UPDATE_POLICY]\n"
+    "REQUIRE_REVIEW = true\n"
+    "PROTECTED_PATHS = libs/core/*,other/path\n"
+).encode('utf-8')
+_MINIMAL_BRAIN = (
+    "[BRAIN]\n"
+    "ID = minimal-brain\n\n"
+    "[EXPORT]\n" 
+    "libs/* = readonly\n" 
+).encode('utf-8')
+_BRAIN_MISSING_ID = (
+    "[BRAIN]\n"
+    "DESCRIPTION = Test brain repository\n\n"
+    "[EXPORT]\n"
+    "libs/* = readonly\n"
+).encode('utf-8')
+_BRAIN_MISSING_EXPORT = (
+    "[BRAIN]\n"
+    "ID = test-brain\n"
+).encode('utf-8')
+
+# (name, content, expected top-level values or exception type, expected error pattern)
+BRAIN_CASES = [
+    ("valid", _VALID_BRAIN, {
+        'ID': 'test-brain',
+        'DESCRIPTION': 'Test brain repository',
+        'EXPORT': {'libs/**/*.py': 'readonly', 'config/*.json': 'readwrite'},
+        'ACCESS': {'user1': ['libs/**/*.py', 'config/*.json'], 'group_all': ['*']},
+        'UPDATE_POLICY': {'REQUIRE_REVIEW': True, 'PROTECTED_PATHS': ['libs/core/*', 'other/path']},
+    }, None),
+    ("minimal", _MINIMAL_BRAIN, {
+        'ID': 'minimal-brain',
+        'EXPORT': {'libs/*': 'readonly'},
+        'DESCRIPTION': _MISSING,
+        'ACCESS': _MISSING,
+        'UPDATE_POLICY': _MISSING,
+    }, None),
+    ("missing_id", _BRAIN_MISSING_ID, BrainConfigError, _MISSING_ID),
+    ("missing_export", _BRAIN_MISSING_EXPORT, BrainConfigError, _MISSING_EXPORT),
+]
+
+_VALID_NEURONS = (
+    "[BRAIN:core-lib]\n"
+    "REMOTE = git@github.com:org/core-lib.git\nBRANCH = main\n\n"
+    "[BRAIN:analytics]\n"
+    "REMOTE = git@github.com:org/analytics.git\nBRANCH = stable\n\n"
+    "[SYNC_POLICY]\n"
+    "AUTO_SYNC_ON_PULL = true\nCONFLICT_STRATEGY = prompt\n"
+    "ALLOW_LOCAL_MODIFICATIONS = false\nALLOW_PUSH_TO_BRAIN = false\n\n"
+    "[MAP]\n"
+    "map_str = core-lib::libs/utils/strings.py::src/utils/strings.py\n"
+    "map_cfg = core-lib::libs/config/::config/\n"
+    "map_model = analytics::models/linear.py::src/models/linear.py\n"
+).encode('utf-8')
+_MINIMAL_NEURONS = (
+    "[BRAIN:minimal]\n"
+    "REMOTE = git@github.com:org/minimal.git\n\n"
+    "[MAP]\n"
+    "map0 = minimal::lib/utils.py::src/utils.py\n"
+).encode('utf-8')
+_NEURONS_MISSING_MAP = "[BRAIN:core-lib]\nREMOTE = git@example.com/repo.git\n".encode('utf-8')
+_NEURONS_EMPTY_MAP = "[BRAIN:core-lib]\nREMOTE = r\n\n[MAP]\n".encode('utf-8')
+_NEURONS_UNKNOWN_BRAIN = (
+    "[BRAIN:core-lib]\nREMOTE = git@example.com/core.git\n\n"
+    "[MAP]\n"
+    "map_unknown = unknown_brain::path/src::path/dst\n"
+).encode('utf-8')
+
+DEFAULT_SYNC_POLICY = {
+    'AUTO_SYNC_ON_PULL': True,
+    'CONFLICT_STRATEGY': 'prompt',
+    'ALLOW_LOCAL_MODIFICATIONS': False,
+    'ALLOW_PUSH_TO_BRAIN': False,
+    'AUTO_SYNC_ON_CHECKOUT': False,
+}
+
+# (name, content, expected top-level values or exception type, expected error pattern)
+NEURONS_CASES = [
+    ("valid", _VALID_NEURONS, {
+        'BRAINS': {
+            'core-lib': {'REMOTE': 'git@github.com:org/core-lib.git', 'BRANCH': 'main'},
+            'analytics': {'REMOTE': 'git@github.com:org/analytics.git', 'BRANCH': 'stable'},
+        },
+        'SYNC_POLICY': DEFAULT_SYNC_POLICY,
+        'MAP': [
+            {'brain_id': 'core-lib', 'source': 'libs/utils/strings.py',
+             'destination': 'src/utils/strings.py', '_map_key': 'map_str'},
+            {'brain_id': 'core-lib', 'source': 'libs/config/',
+             'destination': 'config/', '_map_key': 'map_cfg'},
+            {'brain_id': 'analytics', 'source': 'models/linear.py',
+             'destination': 'src/models/linear.py', '_map_key': 'map_model'},
+        ],
+    }, None),
+    ("minimal", _MINIMAL_NEURONS, {
+        'BRAINS': {'minimal': {'REMOTE': 'git@github.com:org/minimal.git'}},
+        'SYNC_POLICY': DEFAULT_SYNC_POLICY,
+        'MAP': [{'brain_id': 'minimal', 'source': 'lib/utils.py',
+                 'destination': 'src/utils.py', '_map_key': 'map0'}],
+    }, None),
+    ("missing_map", _NEURONS_MISSING_MAP, NeuronsConfigError, _MISSING_MAP),
+    ("empty_map", _NEURONS_EMPTY_MAP, {'MAP': []}, None),
+    ("unknown_brain", _NEURONS_UNKNOWN_BRAIN, NeuronsConfigError, _UNKNOWN_BRAIN),
+]
+
+
+class TestConfigBase(unittest.TestCase):
+    """Base class that shares one temporary directory across a test class."""
     
-    def test_load_valid_brain_config(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Description:
-            Tests loading a valid .brain configuration file with all possible sections.
+            Creates the temporary directory that the class's file-backed tests write into.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that the loaded configuration matches expected values
+            None
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .brain file with test content.
-        # --------------------------------------------------------------
-        content = (
-            "[BRAIN]\n"
-            "ID = test-brain\n" 
-            "DESCRIPTION = Test brain repository\n\n"
-            "[EXPORT]\n"
-            "libs/**/*.py = readonly\n"
-            "config/*.json = readwrite\n\n"
-            "[ACCESS]\n"
-            "user1 = libs/**/*.py, config/*.json\n" 
-            "group_all = *\n\n"
-            "[UPDATE_POLICY]\n"
-            "REQUIRE_REVIEW = true\n"
-            "PROTECTED_PATHS = libs/core/*,other/path\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".brain", encoding='utf-8') as f:
-            f.write(content)
-            brain_file = f.name
-        
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Load the configuration and verify its contents.
-            # --------------------------------------------------------------
-            config = load_brain_config(brain_file)
-            
-            # ===============
-            # Sub step 2.1: Verify basic brain properties.
-            # ===============
-            self.assertEqual(config['ID'], 'test-brain')
-            self.assertEqual(config['DESCRIPTION'], 'Test brain repository')
-            
-            # ===============
-            # Sub step 2.2: Verify EXPORT section.
-            # ===============
-            self.assertIn('EXPORT', config)
-            self.assertEqual(config['EXPORT']['libs/**/*.py'], 'readonly')
-            self.assertEqual(config['EXPORT']['config/*.json'], 'readwrite')
-            
-            # ===============
-            # Sub step 2.3: Verify ACCESS section.
-            # ===============
-            self.assertIn('ACCESS', config)
-            self.assertEqual(config['ACCESS']['user1'], ['libs/**/*.py', 'config/*.json'])
-            self.assertEqual(config['ACCESS']['group_all'], ['*'])
-            
-            # ===============
-            # Sub step 2.4: Verify UPDATE_POLICY section.
-            # ===============
-            self.assertIn('UPDATE_POLICY', config)
-            self.assertEqual(config['UPDATE_POLICY']['REQUIRE_REVIEW'], True)
-            self.assertEqual(config['UPDATE_POLICY']['PROTECTED_PATHS'], ['libs/core/*', 'other/path'])
-        finally:
-            # Clean up the temporary file.
-            os.unlink(brain_file)
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp = cls._tmp.name
     
-    def test_load_minimal_brain_config(self):
+    @classmethod
+    def tearDownClass(cls):
         """
         Description:
-            Tests loading a minimal valid .brain file with only the required fields.
+            Removes the shared temporary directory and everything written into it.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that the loaded configuration has minimal required fields
-                  and does not contain optional sections
+            None
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .brain file with minimal content.
-        # --------------------------------------------------------------
-        content = (
-            "[BRAIN]\n"
-            "ID = minimal-brain\n\n"
-            "[EXPORT]\n" 
-            "libs/* = readonly\n" 
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".brain", encoding='utf-8') as f:
-            f.write(content)
-            brain_file = f.name
+        cls._tmp.cleanup()
+    
+    def config_path(self, suffix):
+        """
+        Description:
+            Returns a path in the shared directory named after the running test.
         
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Load the configuration and verify its contents.
-            # --------------------------------------------------------------
-            config = load_brain_config(brain_file)
-            
-            # ===============
-            # Sub step 2.1: Verify required fields are present.
-            # ===============
-            self.assertEqual(config['ID'], 'minimal-brain')
-            self.assertIn('EXPORT', config)
-            self.assertEqual(config['EXPORT']['libs/*'], 'readonly')
+        Parameters:
+            suffix (str): File extension, e.g. '.brain' or '.neurons'
             
-            # ===============
-            # Sub step 2.2: Verify optional fields are not present.
-            # ===============
-            self.assertNotIn('DESCRIPTION', config) 
-            self.assertNotIn('ACCESS', config)
-            self.assertNotIn('UPDATE_POLICY', config)
-        finally:
-            # Clean up the temporary file.
-            os.unlink(brain_file)
+        Returns:
+            str: Path unique to the current test method
+        """
+        return os.path.join(self.tmp, f"{self._testMethodName}{suffix}")
     
-    def test_missing_required_id_field(self):
+    def assert_cases(self, loader, cases):
         """
         Description:
-            Tests that loading a .brain file without a required ID field raises the
-            appropriate error.
+            Loads each case's content through `loader` in its own subTest and checks
+            either the listed top-level values or the raised error and its message.
         
         Parameters:
-            None
+            loader (Callable): Stream loader, e.g. load_brain_config_stream
+            cases (list): (name, content, expected, expected_msg) tuples, where expected
+                          is a dict of top-level values (_MISSING for absent keys) or an
+                          exception type whose message must match the compiled expected_msg
             
         Returns:
-            None: Asserts that a BrainConfigError is raised with appropriate message
+            None
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .brain file without ID field.
-        # --------------------------------------------------------------
-        content = (
-            "[BRAIN]\n"
-            "DESCRIPTION = Test brain repository\n\n"
-            "[EXPORT]\n"
-            "libs/* = readonly\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".brain", encoding='utf-8') as f:
-            f.write(content)
-            brain_file = f.name
-        
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Attempt to load the config and verify the error.
-            # --------------------------------------------------------------
-            with self.assertRaises(BrainConfigError) as cm:
-                load_brain_config(brain_file)
-            # Verify the error message mentions the missing ID field.
-            self.assertIn("Missing required ID field", str(cm.exception))
-        finally:
-            # Clean up the temporary file.
-            os.unlink(brain_file)
+        for name, content, expected, expected_msg in cases:
+            with self.subTest(name=name):
+                # ===============
+                # Error cases: the loader must raise with the expected message.
+                # ===============
+                if isinstance(expected, type):
+                    with self.assertRaisesRegex(expected, expected_msg):
+                        loader(io.BytesIO(content))
+                    continue
+                
+                # ===============
+                # Success cases: compare only the listed top-level keys.
+                # ===============
+                config = loader(io.BytesIO(content))
+                for key, value in expected.items():
+                    self.assertEqual(config.get(key, _MISSING), value, key)
 
-    def test_missing_export_section(self):
+
+class TestBrainConfig(TestConfigBase):
+    """Test loading and parsing .brain configuration files."""
+    
+    def test_brain_matrix(self):
         """
         Description:
-            Tests that loading a .brain file without the required EXPORT section
-            raises the appropriate error.
+            Tests loading valid, minimal and invalid .brain contents, checking the parsed
+            values or the raised BrainConfigError and its message for each case.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that a BrainConfigError is raised with appropriate message
+            None: Asserts the outcome of every case in BRAIN_CASES
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .brain file without EXPORT section.
-        # --------------------------------------------------------------
-        content = (
-            "[BRAIN]\n"
-            "ID = test-brain\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".brain", encoding='utf-8') as f:
-            f.write(content)
-            brain_file = f.name
-        
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Attempt to load the config and verify the error.
-            # --------------------------------------------------------------
-            with self.assertRaises(BrainConfigError) as cm:
-                load_brain_config(brain_file)
-            # Check the actual error message more reliably.
-            self.assertTrue("Missing required [EXPORT] section" in str(cm.exception))
-        finally:
-            # Clean up the temporary file.
-            os.unlink(brain_file)
+        self.assert_cases(load_brain_config_stream, BRAIN_CASES)
 
     def test_save_brain_config(self):
         """
@@ -233,232 +270,182 @@ class TestBrainConfig(unittest.TestCase):
         }
         
         # --------------------------------------------------------------
-        # STEP 2: Create a temporary file and save/load the configuration.
+        # STEP 2: Save/load the configuration through a file in the shared directory.
         # --------------------------------------------------------------
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix=".brain", encoding='utf-8') as f:
-            brain_file_path = f.name
-        
-        try:
-            # ===============
-            # Sub step 2.1: Save the configuration to the file.
-            # ===============
-            save_brain_config(config_to_save, brain_file_path)
-            
-            # ===============
-            # Sub step 2.2: Load the configuration back from the file.
-            # ===============
-            loaded_config = load_brain_config(brain_file_path)
-            
-            # --------------------------------------------------------------
-            # STEP 3: Verify that loaded configuration matches the original.
-            # --------------------------------------------------------------
-            self.assertEqual(loaded_config['ID'], config_to_save['ID'])
-            self.assertEqual(loaded_config['DESCRIPTION'], config_to_save['DESCRIPTION'])
-            self.assertEqual(loaded_config['EXPORT'], config_to_save['EXPORT'])
-            self.assertEqual(loaded_config['ACCESS'], config_to_save['ACCESS'])
-            self.assertEqual(loaded_config['UPDATE_POLICY']['AUTO_APPROVE'], False)
-            self.assertEqual(loaded_config['UPDATE_POLICY']['NOTIFY_LIST'], 'dev@example.com,qa@example.com')
-        finally:
-            # Clean up the temporary file.
-            os.unlink(brain_file_path)
+        brain_file_path = self.config_path('.brain')
+        self.assertFalse(os.path.exists(brain_file_path))  # The save must create the file
 
+        # ===============
+        # Sub step 2.1: Save the configuration to the file.
+        # ===============
+        save_brain_config(config_to_save, brain_file_path)
+        self.assertFalse([name for name in os.listdir(self.tmp) if name.endswith('.tmp')])
+        
+        # ===============
+        # Sub step 2.2: Load the configuration back from the file.
+        # ===============
+        loaded_config = load_brain_config(brain_file_path)
+        
+        # --------------------------------------------------------------
+        # STEP 3: Verify that loaded configuration matches the original.
+        # --------------------------------------------------------------
+        self.assertEqual(loaded_config['ID'], config_to_save['ID'])
+        self.assertEqual(loaded_config['DESCRIPTION'], config_to_save['DESCRIPTION'])
+        self.assertEqual(loaded_config['EXPORT'], config_to_save['EXPORT'])
+        self.assertEqual(loaded_config['ACCESS'], config_to_save['ACCESS'])
+        self.assertEqual(loaded_config['UPDATE_POLICY']['AUTO_APPROVE'], False)
+        self.assertEqual(loaded_config['UPDATE_POLICY']['NOTIFY_LIST'], 'dev@example.com,qa@example.com')
 
-class TestNeuronsConfig(unittest.TestCase):
-    """Test loading and parsing .neurons configuration files."""
-    
-    def test_load_valid_neurons_config(self):
+    @unittest.skipIf(os.name != 'posix', "symlinks and permission bits are POSIX-specific")
+    def test_save_keeps_symlink_and_mode(self):
         """
         Description:
-            Tests loading a valid .neurons configuration file with all possible sections.
+            Tests that saving through a symlinked .brain rewrites the link's target,
+            keeps the link, and preserves the target's permission bits, while a new
+            file gets the umask-filtered default mode.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that the loaded configuration matches expected values
+            None: Asserts the link, the target's new content and both modes
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .neurons file with test content.
-        # --------------------------------------------------------------
-        content = (
-            "[BRAIN:core-lib]\n"
-            "REMOTE = git@github.com:org/core-lib.git\nBRANCH = main\n\n"
-            "[BRAIN:analytics]\n"
-            "REMOTE = git@github.com:org/analytics.git\nBRANCH = stable\n\n"
-            "[SYNC_POLICY]\n"
-            "AUTO_SYNC_ON_PULL = true\nCONFLICT_STRATEGY = prompt\n"
-            "ALLOW_LOCAL_MODIFICATIONS = false\nALLOW_PUSH_TO_BRAIN = false\n\n"
-            "[MAP]\n"
-            "map_str = core-lib::libs/utils/strings.py::src/utils/strings.py\n"
-            "map_cfg = core-lib::libs/config/::config/\n"
-            "map_model = analytics::models/linear.py::src/models/linear.py\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            f.write(content)
-            neurons_file = f.name
+        target_path = self.config_path('.brain.target')
+        link_path = self.config_path('.brain')
+        with open(target_path, 'wb') as f:
+            f.write(_MINIMAL_BRAIN)
+        os.chmod(target_path, 0o600)
+        os.symlink(target_path, link_path)
+        
+        save_brain_config({'ID': 'saved-through-link', 'EXPORT': {'*': 'readonly'}}, link_path)
         
+        self.assertTrue(os.path.islink(link_path))
+        self.assertEqual(load_brain_config(target_path)['ID'], 'saved-through-link')
+        self.assertEqual(os.stat(target_path).st_mode & 0o777, 0o600)
+        
+        new_path = self.config_path('.brain.new')
+        umask = os.umask(0o027)
         try:
-            # --------------------------------------------------------------
-            # STEP 2: Load the configuration and verify its contents.
-            # --------------------------------------------------------------
-            config = load_neurons_config(neurons_file)
-            
-            # ===============
-            # Sub step 2.1: Verify BRAINS section entries.
-            # ===============
-            self.assertIn('core-lib', config['BRAINS'])
-            self.assertEqual(config['BRAINS']['core-lib']['REMOTE'], 'git@github.com:org/core-lib.git')
-            
-            # ===============
-            # Sub step 2.2: Verify SYNC_POLICY settings.
-            # ===============
-            self.assertEqual(config['SYNC_POLICY']['AUTO_SYNC_ON_PULL'], True)
-            
-            # ===============
-            # Sub step 2.3: Verify MAP entries.
-            # ===============
-            self.assertEqual(len(config['MAP']), 3)
-            map_values = [(m['brain_id'], m['source'], m['destination']) for m in config['MAP']]
-            self.assertIn(('core-lib', 'libs/utils/strings.py', 'src/utils/strings.py'), map_values)
+            save_brain_config({'ID': 'new-file', 'EXPORT': {'*': 'readonly'}}, new_path)
         finally:
-            # Clean up the temporary file.
-            os.unlink(neurons_file)
-    
-    def test_load_minimal_neurons_config(self):
+            os.umask(umask)
+        self.assertEqual(os.stat(new_path).st_mode & 0o777, 0o640)
+
+    def test_cache_hit(self):
         """
         Description:
-            Tests loading a minimal valid .neurons file with only the required fields.
+            Tests that a memoized load is served from the in-process cache without
+            reparsing, and that touching the source file invalidates the entry.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that the loaded configuration has minimal required fields
-                  and default values for optional settings
+            None: Asserts cache reuse and invalidation
         """
         # --------------------------------------------------------------
-        # STEP 1: Create a temporary .neurons file with minimal content.
+        # STEP 1: Load once to fill the cache, then again without parsing.
         # --------------------------------------------------------------
-        content = (
-            "[BRAIN:minimal]\n"
-            "REMOTE = git@github.com:org/minimal.git\n\n"
-            "[MAP]\n"
-            "map0 = minimal::lib/utils.py::src/utils.py\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            f.write(content)
-            neurons_file = f.name
+        brain_file_path = self.config_path('.brain')
+        with open(brain_file_path, 'wb') as f:
+            f.write(_MINIMAL_BRAIN)
+        config = load_brain_config(brain_file_path, memoize=True)
+        with mock.patch('brain.config.load_brain_config_stream', side_effect=AssertionError("reparsed")):
+            self.assertEqual(load_brain_config(brain_file_path, memoize=True), config)
         
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Load the configuration and verify its contents.
-            # --------------------------------------------------------------
-            config = load_neurons_config(neurons_file)
-            
-            # ===============
-            # Sub step 2.1: Verify required fields are present.
-            # ===============
-            self.assertEqual(config['BRAINS']['minimal']['REMOTE'], 'git@github.com:org/minimal.git')
-            self.assertEqual(config['MAP'][0]['source'], 'lib/utils.py')
-            
-            # ===============
-            # Sub step 2.2: Verify default values for optional settings.
-            # ===============
-            # Default value for AUTO_SYNC_ON_PULL should be True.
-            self.assertEqual(config['SYNC_POLICY']['AUTO_SYNC_ON_PULL'], True) 
-        finally:
-            # Clean up the temporary file.
-            os.unlink(neurons_file)
+        # --------------------------------------------------------------
+        # STEP 2: Touch the source with new content; the entry must be refreshed.
+        # --------------------------------------------------------------
+        with open(brain_file_path, 'wb') as f:
+            f.write(_VALID_BRAIN)
+        st = os.stat(brain_file_path)
+        os.utime(brain_file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(load_brain_config(brain_file_path, memoize=True)['ID'], 'test-brain')
+        with mock.patch('brain.config.load_brain_config_stream', side_effect=AssertionError("reparsed")):
+            self.assertEqual(load_brain_config(brain_file_path, memoize=True)['ID'], 'test-brain')
+        
+        clear_load_cache()
+        with mock.patch('brain.config.load_brain_config_stream', side_effect=AssertionError("reparsed")):
+            self.assertRaises(AssertionError, load_brain_config, brain_file_path, memoize=True)
+
 
-    def test_missing_map_section_error(self):
+class TestNeuronsConfig(TestConfigBase):
+    """Test loading and parsing .neurons configuration files."""
+    
+    def test_neurons_matrix(self):
         """
         Description:
-            Tests that loading a .neurons file without the required MAP section
-            raises the appropriate error.
+            Tests loading valid, minimal and invalid .neurons contents, checking the parsed
+            values or the raised NeuronsConfigError and its message for each case.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that a NeuronsConfigError is raised with appropriate message
+            None: Asserts the outcome of every case in NEURONS_CASES
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .neurons file without MAP section.
-        # --------------------------------------------------------------
-        content = "[BRAIN:core-lib]\nREMOTE = git@example.com/repo.git\n"
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            f.write(content); neurons_file = f.name
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Attempt to load the config and verify the error.
-            # --------------------------------------------------------------
-            with self.assertRaises(NeuronsConfigError) as cm:
-                load_neurons_config(neurons_file)
-            # Verify the error message mentions the missing MAP section.
-            self.assertIn("Missing required [MAP] section", str(cm.exception))
-        finally: 
-            # Clean up the temporary file.
-            os.unlink(neurons_file)
+        self.assert_cases(load_neurons_config_stream, NEURONS_CASES)
 
-    def test_empty_map_section_allowed(self):
+    def test_sync_policy_is_mutable_copy(self):
         """
         Description:
-            Tests that loading a .neurons file with an empty MAP section is allowed.
+            Tests that each load returns its own mutable SYNC_POLICY, so commands that
+            update the policy in place never touch the shared defaults.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that the configuration loads successfully with an empty MAP
+            None: Asserts that mutating a loaded policy leaves the defaults unchanged
         """
-        # --------------------------------------------------------------
-        # STEP 1: Create a temporary .neurons file with empty MAP section.
-        # --------------------------------------------------------------
-        content = "[BRAIN:core-lib]\nREMOTE = r\n\n[MAP]\n" 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            f.write(content); neurons_file = f.name
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Load the configuration and verify empty MAP.
-            # --------------------------------------------------------------
-            config = load_neurons_config(neurons_file)
-            # Verify that the MAP section is empty but exists.
-            self.assertEqual(len(config['MAP']), 0)
-        finally:
-            # Clean up the temporary file.
-            os.unlink(neurons_file)
+        config = load_neurons_config_stream(io.BytesIO(_MINIMAL_NEURONS))
+        config['SYNC_POLICY']['CONFLICT_STRATEGY'] = 'prefer_brain'
+        self.assertEqual(CONFIG_DEFAULT_SYNC_POLICY['CONFLICT_STRATEGY'], 'prompt')
+        self.assertEqual(load_neurons_config_stream(io.BytesIO(_MINIMAL_NEURONS))['SYNC_POLICY'], DEFAULT_SYNC_POLICY)
 
-    def test_unknown_brain_in_map(self):
+    def test_load_cache_returns_copies(self):
         """
         Description:
-            Tests that loading a .neurons file with a MAP entry referencing an
-            undefined brain raises the appropriate error.
+            Tests that repeated memoized loads of an unchanged file are served from the
+            in-process cache as independent copies, and that saving the file invalidates
+            the entry.
         
         Parameters:
             None
             
         Returns:
-            None: Asserts that a NeuronsConfigError is raised with appropriate message
+            None: Asserts cache reuse, copy isolation and invalidation on save
         """
         # --------------------------------------------------------------
-        # STEP 1: Create a temporary .neurons file with unknown brain in MAP.
+        # STEP 1: Load once, then again without the parser running.
         # --------------------------------------------------------------
-        content = (
-            "[BRAIN:core-lib]\nREMOTE = git@example.com/core.git\n\n"
-            "[MAP]\n"
-            "map_unknown = unknown_brain::path/src::path/dst\n"
-        )
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            f.write(content); neurons_file = f.name
-        try:
-            # --------------------------------------------------------------
-            # STEP 2: Attempt to load the config and verify the error.
-            # --------------------------------------------------------------
-            with self.assertRaisesRegex(NeuronsConfigError, "Unknown brain 'unknown_brain'"):
-                load_neurons_config(neurons_file)
-        finally:
-            # Clean up the temporary file.
-            os.unlink(neurons_file)
+        neurons_file_path = self.config_path('.neurons')
+        with open(neurons_file_path, 'wb') as f:
+            f.write(_MINIMAL_NEURONS)
+        first = load_neurons_config(neurons_file_path, memoize=True)
+        first['MAP'].append({'brain_id': 'minimal', 'source': 'a', 'destination': 'b'})
+        with mock.patch('brain.config.load_neurons_config_stream', side_effect=AssertionError("reparsed")):
+            second = load_neurons_config(neurons_file_path, memoize=True)
+            second['SYNC_POLICY']['CONFLICT_STRATEGY'] = 'prefer_brain'
+            third = load_neurons_config(neurons_file_path, memoize=True)
+        
+        # ===============
+        # Sub step 1.1: Mutating one result must not leak into the next.
+        # ===============
+        self.assertEqual(len(second['MAP']), 1)
+        self.assertEqual(third['SYNC_POLICY']['CONFLICT_STRATEGY'], 'prompt')
+        
+        # ===============
+        # Sub step 1.2: Loads without memoize always parse.
+        # ===============
+        with mock.patch('brain.config.load_neurons_config_stream', side_effect=AssertionError("reparsed")):
+            self.assertRaises(AssertionError, load_neurons_config, neurons_file_path)
+        
+        # --------------------------------------------------------------
+        # STEP 2: Saving the file must make the next load parse it again.
+        # --------------------------------------------------------------
+        save_neurons_config(first, neurons_file_path)
+        self.assertEqual(len(load_neurons_config(neurons_file_path, memoize=True)['MAP']), 2)
 
     def test_save_neurons_config(self):
         """
@@ -482,31 +469,35 @@ class TestNeuronsConfig(unittest.TestCase):
         }
         
         # --------------------------------------------------------------
-        # STEP 2: Create a temporary file and save/load the configuration.
+        # STEP 2: Save/load the configuration through a file in the shared directory.
         # --------------------------------------------------------------
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix=".neurons", encoding='utf-8') as f:
-            neurons_file_path = f.name
-        try:
-            # ===============
-            # Sub step 2.1: Save the configuration to the file.
-            # ===============
-            save_neurons_config(config_to_save, neurons_file_path)
-            
-            # ===============
-            # Sub step 2.2: Load the configuration back from the file.
-            # ===============
-            loaded_config = load_neurons_config(neurons_file_path)
-            
-            # --------------------------------------------------------------
-            # STEP 3: Verify that loaded configuration matches the original.
-            # --------------------------------------------------------------
-            self.assertEqual(loaded_config['BRAINS']['core']['BRANCH'], 'dev')
-            self.assertEqual(loaded_config['SYNC_POLICY']['AUTO_SYNC_ON_PULL'], False)
-            self.assertEqual(loaded_config['MAP'][0]['_map_key'], 'customKey')
-            self.assertEqual(loaded_config['MAP'][0]['source'], 's')
-        finally:
-            # Clean up the temporary file.
-            os.unlink(neurons_file_path)
+        neurons_file_path = self.config_path('.neurons')
+        self.assertFalse(os.path.exists(neurons_file_path))  # The save must create the file
+
+        # ===============
+        # Sub step 2.1: Save the configuration to the file.
+        # ===============
+        save_neurons_config(config_to_save, neurons_file_path)
+        self.assertFalse([name for name in os.listdir(self.tmp) if name.endswith('.tmp')])
+        
+        # ===============
+        # Sub step 2.2: Load the configuration back from the file.
+        # ===============
+        loaded_config = load_neurons_config(neurons_file_path)
+        
+        # --------------------------------------------------------------
+        # STEP 3: Verify that loaded configuration matches the original.
+        # --------------------------------------------------------------
+        self.assertEqual(loaded_config['BRAINS']['core']['BRANCH'], 'dev')
+        self.assertEqual(loaded_config['SYNC_POLICY']['AUTO_SYNC_ON_PULL'], False)
+        self.assertEqual(loaded_config['MAP'][0]['_map_key'], 'customKey')
+        self.assertEqual(loaded_config['MAP'][0]['source'], 's')
+        self.assertIsInstance(loaded_config['MAP'], list)
+        columns = map_columns(loaded_config)
+        self.assertEqual(
+            list(zip(columns['brain_id'], columns['source'], columns['destination'])),
+            [('core', 's', 'd')]
+        )
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
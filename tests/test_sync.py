@@ -5,6 +5,10 @@ These tests verify that neurons are correctly synchronized between
 brain repositories and consumer repositories.
 """
 
+import concurrent.futures
+import dataclasses
+import os
+import shutil
 import tempfile
 import unittest
 from unittest import mock
@@ -19,32 +23,166 @@ from brain.sync import (
     parse_requirements,
     merge_requirements
 )
-
-def run_git_in_path(path: str, args: list, check=True, initial_branch_name="main"):
+from tests.test_commands import (GIT_CLOSE_FDS, GIT_TEST_COMMAND, GIT_TEST_ENV, _TMP_BASE, GitBatchClient,
+                                 _write_files, build_fast_import_stream)
+
+# Test repositories are throwaway: no auto-gc, signing, hooks or fsync of packs, refs and the
+# index. The fixed identity lets commits run without reading the user's global config.
+GIT_SYNC_TEST_COMMAND = GIT_TEST_COMMAND + [
+    '-c', 'core.fsync=none', '-c', f'core.hooksPath={os.devnull}',
+    '-c', 'user.name=Brain Tests', '-c', 'user.email=brain-tests@example.com',
+]
+# The command tests' git environment, with ~/.gitconfig skipped as well as /etc/gitconfig.
+GIT_SYNC_TEST_ENV = {**GIT_TEST_ENV, 'GIT_CONFIG_GLOBAL': os.devnull}
+# Where failed sync tests leave their directories: current-run/ for this run, prev-run/ for the one before.
+_KEPT_TEST_DIRS_ROOT = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                    'brain-tests')
+
+def run_git_in_path(path: str, args: list, check=True, initial_branch_name="main", capture=False):
     """
     Description:
-        Executes a git command in the specified path.
+        Executes a git command in the specified path. Standard output is discarded
+        unless `capture` is set; standard error is always kept to report failures.
     
     Parameters:
         path (str): The directory path where the git command will be executed.
         args (list): The git command arguments as a list.
         check (bool): If True, checks that the command executed successfully.
         initial_branch_name (str): The name of the initial branch when using git init.
+        capture (bool): Whether to capture stdout as text on the result.
 
     Returns:
         result (subprocess.CompletedProcess): The result of the git command execution.
     """
     if args[0] == 'init' and initial_branch_name:
-        res = subprocess.run(['git', 'init', '-b', initial_branch_name] + args[1:], cwd=path, check=check, capture_output=True, text=True)
+        cmd = GIT_SYNC_TEST_COMMAND + ['init', '-b', initial_branch_name, '--template='] + args[1:]
     else:
-        res = subprocess.run(['git'] + args, cwd=path, check=check, capture_output=True, text=True)
+        cmd = GIT_SYNC_TEST_COMMAND + args
+    res = subprocess.run(cmd, cwd=path, stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                         stderr=subprocess.PIPE, text=True, env=GIT_SYNC_TEST_ENV, close_fds=GIT_CLOSE_FDS)
     if check and res.returncode != 0:
         print(f"Git command failed in sync test setup: {' '.join(args)}")
         print(f"Stdout: {res.stdout}")
         print(f"Stderr: {res.stderr}")
+        raise subprocess.CalledProcessError(res.returncode, cmd, res.stdout, res.stderr)
     return res
 
 
+def _rotate_kept_test_dirs():
+    """
+    Description:
+        Starts a new run of kept failed-test directories: the previous run's are
+        removed and the last run's become the previous run's.
+    
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    previous_run = os.path.join(_KEPT_TEST_DIRS_ROOT, 'prev-run')
+    current_run = os.path.join(_KEPT_TEST_DIRS_ROOT, 'current-run')
+    shutil.rmtree(previous_run, ignore_errors=True)
+    if os.path.isdir(current_run):
+        os.rename(current_run, previous_run)
+
+
+@dataclasses.dataclass(frozen=True)
+class NeuronMap:
+    """
+    Description:
+        One [MAP] entry of a test consumer's .neurons file.
+    
+    Parameters:
+        name (str): The mapping key.
+        src (str): The source path inside the brain.
+        dst (str): The destination path inside the consumer repository.
+        brain (str): The brain ID the mapping reads from.
+    """
+    name: str
+    src: str
+    dst: str
+    brain: str = 'sync-brain'
+
+
+# Files committed to the brain repository shared by the sync tests.
+SYNC_BRAIN_FILES = (
+    ('.brain', b"[BRAIN]\nID=sync-brain\n[EXPORT]\n* = readonly\n"),
+    ('libs/utils/strings.py', b"# Brain v1 strings.py\n"),
+    ('libs/utils/strings.pyrequirements.txt', b"requests==2.28.1\n"),
+    ('libs/utils/numbers.py', b"# Brain v1 numbers.py\n"),
+    ('config/settings.json', b'{"brain_ver": "1.0"}\n'),
+    ('dir_neuron/file_a.txt', b"File A in brain dir_neuron\n"),
+    ('dir_neuron/dir_neuronrequirements.txt', b"numpy==1.22.0\n"),
+    ('plain_dir/file_b.txt', b"File B in brain plain_dir\n"),
+)
+
+
+class TestRequirementsPure(unittest.TestCase):
+    """
+    Description:
+        Test case class for the pure requirements helpers, which need no repositories.
+    """
+
+    def test_parse_requirements(self):
+        """
+        Description:
+            Tests the parse_requirements function to ensure it correctly parses
+            requirement specifications from a requirements.txt file: a small file,
+            a 1000-line file, and one with comments, blank lines, markers and extras.
+        
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        bulk_content = "\n".join(f"pkg{i}=={i}.0.0" for i in range(1000))
+        commented_content = (
+            "# header\n\nrequests==2.28.1  # pinned\n   \n"
+            "flask>=2.0.0 ; python_version >= \"3.7\"\ncelery[redis]==5.2.0\nnumpy == 1.22.3\n# trailing comment\n"
+        )
+        # (case name, content, expected dependency count, spot-checked entries)
+        cases = (
+            ('small', "requests==2.28.1\nflask>=2.0.0\nnumpy == 1.22.3\npandas # comment", 4,
+             {'requests': '2.28.1', 'flask': '', 'numpy': '1.22.3', 'pandas': ''}),
+            ('bulk', bulk_content, 1000,
+             {'pkg0': '0.0.0', 'pkg499': '499.0.0', 'pkg999': '999.0.0'}),
+            ('comments_markers_extras', commented_content, 4,
+             {'requests': '2.28.1', 'flask': '', 'celery': '', 'numpy': '1.22.3'}),
+        )
+        for name, content, expected_count, expected_entries in cases:
+            with self.subTest(name):
+                deps = parse_requirements(content)
+                self.assertEqual(len(deps), expected_count)
+                for pkg_name, version in expected_entries.items():
+                    self.assertEqual(deps.get(pkg_name), version, pkg_name)
+
+    def test_merge_requirements(self):
+        """
+        Description:
+            Tests the merge_requirements function to ensure it correctly merges
+            requirements from two different requirements.txt files, preferring
+            neuron versions over repository versions.
+        
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        repo_reqs = "requests==2.27.1\nflask==2.0.0\nnumpy==1.21.0\n"
+        neuron_reqs = "requests==2.28.1\npandas==1.4.2\nnumpy==1.22.0\n" 
+        
+        merged_content = merge_requirements(repo_reqs, neuron_reqs)
+        merged_deps = parse_requirements(merged_content)
+
+        self.assertEqual(merged_deps.get('requests'), '2.28.1') 
+        self.assertEqual(merged_deps.get('flask'), '2.0.0')    
+        self.assertEqual(merged_deps.get('pandas'), '1.4.2')   
+        self.assertEqual(merged_deps.get('numpy'), '1.22.0')
+
+
 class TestNeuronSync(unittest.TestCase):
     """
     Description:
@@ -52,10 +190,12 @@ class TestNeuronSync(unittest.TestCase):
     """
     initial_git_branch_name = "main" # For consistency
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Description:
-            Sets up the test environment with a brain repository and a consumer repository.
+            Builds the brain repository once for the whole class. The tests only read
+            from it, so it is shared; each test gets its own consumer repository in setUp.
         
         Parameters:
             None
@@ -64,80 +204,111 @@ class TestNeuronSync(unittest.TestCase):
             None
         """
         # --------------------------------------------------------------
-        # STEP 1: Set up temporary directories for testing.
+        # STEP 1: Set up the class-level temporary directory (RAM-backed where available).
         # --------------------------------------------------------------
-        self.test_dir_obj = tempfile.TemporaryDirectory()
-        self.test_dir = pathlib.Path(self.test_dir_obj.name)
-
-        self.brain_repo = self.test_dir / 'brain_repo_for_sync'
-        self.consumer_repo = self.test_dir / 'consumer_repo_for_sync'
+        # Directories of failed tests are kept for one more run
+        _rotate_kept_test_dirs()
+        cls._brain_dir_obj = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+        cls.brain_repo = pathlib.Path(cls._brain_dir_obj.name) / 'brain_repo_for_sync'
+        cls.brain_repo_s = str(cls.brain_repo) # str form for helpers and git calls
         
         # --------------------------------------------------------------
         # STEP 2: Initialize brain repository.
         # --------------------------------------------------------------
-        self.brain_repo.mkdir()
-        run_git_in_path(str(self.brain_repo), ['init'], initial_branch_name=self.initial_git_branch_name)
-        
-        # ===============
-        # Sub step 2.1: Create brain configuration.
-        # ===============
-        (self.brain_repo / '.brain').write_text("[BRAIN]\nID=sync-brain\n[EXPORT]\n* = readonly\n")
+        cls.brain_repo.mkdir()
+        run_git_in_path(cls.brain_repo_s, ['init'], initial_branch_name=cls.initial_git_branch_name)
         
         # ===============
-        # Sub step 2.2: Create libraries directory with utilities.
+        # Sub step 2.1: Write all brain files and the initial commit in one fast-import stream.
         # ===============
-        (self.brain_repo / 'libs' / 'utils').mkdir(parents=True, exist_ok=True)
-        (self.brain_repo / 'libs/utils/strings.py').write_text("# Brain v1 strings.py\n")
-        (self.brain_repo / 'libs/utils/strings.pyrequirements.txt').write_text("requests==2.28.1\n")
+        # The tests only clone the brain through its file:// URL, so the commit is not
+        # checked out into the brain's working tree.
+        stream = build_fast_import_stream(cls.initial_git_branch_name, SYNC_BRAIN_FILES,
+                                          f'Initial brain for sync tests on {cls.initial_git_branch_name}')
+        subprocess.run(GIT_SYNC_TEST_COMMAND + ['fast-import', '--quiet'], cwd=cls.brain_repo_s, input=stream, check=True,
+                       env=GIT_SYNC_TEST_ENV, close_fds=GIT_CLOSE_FDS)
+        cls.brain_url = f"file://{cls.brain_repo.resolve().as_posix()}" # Use file:// URL
+        # .neurons content every consumer starts from, encoded once; tests append [MAP] lines
+        cls.base_neurons_bytes = (
+            f"[BRAIN:sync-brain]\nREMOTE = {cls.brain_url}\nBRANCH = {cls.initial_git_branch_name}\n\n"
+            f"[SYNC_POLICY]\nCONFLICT_STRATEGY = prefer_brain\n\n" 
+            "[MAP]\n"
+        ).encode('utf-8')
+        # One cat-file process serves every read of the brain's committed files
+        cls.brain_objects = GitBatchClient(cls.brain_repo_s)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Description:
+            Closes the brain GitBatchClient and removes the shared brain repository.
         
-        # ===============
-        # Sub step 2.3: Create configuration directory.
-        # ===============
-        (self.brain_repo / 'config').mkdir(exist_ok=True)
-        (self.brain_repo / 'config/settings.json').write_text('{"brain_ver": "1.0"}\n')
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        cls.brain_objects.close()
+        cls._brain_dir_obj.cleanup()
+
+    def setUp(self):
+        """
+        Description:
+            Sets up a fresh consumer repository for each test, pointing at the shared
+            brain repository built in setUpClass.
         
-        # ===============
-        # Sub step 2.4: Create neuron directory.
-        # ===============
-        (self.brain_repo / 'dir_neuron').mkdir(exist_ok=True)
-        (self.brain_repo / 'dir_neuron/file_a.txt').write_text("File A in brain dir_neuron\n")
-        (self.brain_repo / 'dir_neuron/dir_neuronrequirements.txt').write_text("numpy==1.22.0\n")
+        Parameters:
+            None
 
-        # ===============
-        # Sub step 2.5: Commit brain repository changes.
-        # ===============
-        run_git_in_path(str(self.brain_repo), ['add', '.'])
-        run_git_in_path(str(self.brain_repo), ['commit', '-m', f'Initial brain for sync tests on {self.initial_git_branch_name}'])
+        Returns:
+            None
+        """
+        # --------------------------------------------------------------
+        # STEP 1: Set up temporary directories for testing.
+        # --------------------------------------------------------------
+        # Removed, or kept if the test fails, by run() once the test and its cleanups are done
+        self.test_dir = pathlib.Path(tempfile.mkdtemp(dir=_TMP_BASE))
+
+        self.consumer_repo = self.test_dir / 'consumer_repo_for_sync'
+        self.consumer_repo_s = str(self.consumer_repo) # str form for helpers and git calls
 
         # --------------------------------------------------------------
-        # STEP 3: Initialize consumer repository.
+        # STEP 2: Initialize consumer repository.
         # --------------------------------------------------------------
         self.consumer_repo.mkdir()
-        run_git_in_path(str(self.consumer_repo), ['init'], initial_branch_name=self.initial_git_branch_name)
+        run_git_in_path(self.consumer_repo_s, ['init'], initial_branch_name=self.initial_git_branch_name)
         
         # ===============
-        # Sub step 3.1: Set up consumer configuration.
+        # Sub step 2.1: Set up consumer configuration.
         # ===============
-        self.brain_url = f"file://{self.brain_repo.resolve().as_posix()}" # Use file:// URL
-        self.base_neurons_content = (
-            f"[BRAIN:sync-brain]\nREMOTE = {self.brain_url}\nBRANCH = {self.initial_git_branch_name}\n\n"
-            f"[SYNC_POLICY]\nCONFLICT_STRATEGY = prefer_brain\n\n" 
-            "[MAP]\n"
-        )
-        (self.consumer_repo / '.neurons').write_text(self.base_neurons_content)
+        _write_files(self.consumer_repo_s, {'.neurons': self.base_neurons_bytes})
 
-    def tearDown(self):
+    def run(self, result=None):
         """
         Description:
-            Cleans up the test environment by removing temporary directories.
+            Runs the test, then removes its temporary directory, or moves it under
+            _KEPT_TEST_DIRS_ROOT/current-run/<test id> when the test failed or errored,
+            so the repositories can be inspected afterwards.
         
         Parameters:
-            None
+            result (unittest.TestResult): The result to record the outcome in (default: a new one).
 
         Returns:
-            None
+            result (unittest.TestResult): The result the outcome was recorded in.
         """
-        self.test_dir_obj.cleanup()
+        problems_before = len(result.failures) + len(result.errors) if result is not None else 0
+        result = super().run(result)
+        test_dir = getattr(self, 'test_dir', None)
+        if test_dir is not None and os.path.isdir(test_dir):
+            if result is not None and len(result.failures) + len(result.errors) > problems_before:
+                kept_dir = os.path.join(_KEPT_TEST_DIRS_ROOT, 'current-run', self.id())
+                shutil.rmtree(kept_dir, ignore_errors=True)
+                os.makedirs(os.path.dirname(kept_dir), exist_ok=True)
+                shutil.move(str(test_dir), kept_dir)
+            else:
+                shutil.rmtree(test_dir, ignore_errors=True)
+        return result
 
     def _get_consumer_config(self):
         """
@@ -150,50 +321,85 @@ class TestNeuronSync(unittest.TestCase):
         Returns:
             config (dict): The loaded neuron configuration.
         """
-        return load_neurons_config(str(self.consumer_repo / '.neurons'))
+        return load_neurons_config(os.path.join(self.consumer_repo_s, '.neurons'))
 
-    def test_parse_requirements(self):
+    def _render_neurons(self, neuron_maps: list) -> bytes:
         """
         Description:
-            Tests the parse_requirements function to ensure it correctly parses
-            requirement specifications from a requirements.txt file.
+            Renders the consumer's .neurons content: the class's base content followed by
+            one [MAP] line per mapping.
         
         Parameters:
-            None
+            neuron_maps (list): The NeuronMap entries to write under [MAP].
 
         Returns:
-            None
+            content (bytes): The .neurons file content.
         """
-        content = "requests==2.28.1\nflask>=2.0.0\nnumpy == 1.22.3\npandas # comment"
-        deps = parse_requirements(content)
-        self.assertEqual(deps.get('requests'), '2.28.1')
-        self.assertEqual(deps.get('flask'), '') 
-        self.assertEqual(deps.get('numpy'), '1.22.3')
-        self.assertEqual(deps.get('pandas'), '')
+        return self.base_neurons_bytes + "".join(
+            f"{m.name} = {m.brain}::{m.src}::{m.dst}\n" for m in neuron_maps
+        ).encode('utf-8')
 
-    def test_merge_requirements(self):
+    def _prepare_consumer(self, neuron_maps: list, extra_files: dict = None, dest_dirs: list = None):
         """
         Description:
-            Tests the merge_requirements function to ensure it correctly merges
-            requirements from two different requirements.txt files, preferring
-            neuron versions over repository versions.
+            Writes the consumer's .neurons with the given [MAP] entries, plus any extra
+            files, in one _write_files call, then creates the destination directories.
         
         Parameters:
+            neuron_maps (list): The NeuronMap entries to write under [MAP].
+            extra_files (dict): Additional relative path -> bytes files to write (default: none).
+            dest_dirs (list): Relative directories to create in the consumer (default: none).
+
+        Returns:
             None
+        """
+        files = {'.neurons': self._render_neurons(neuron_maps)}
+        files.update(extra_files or {})
+        _write_files(self.consumer_repo_s, files)
+        for dest_dir in dest_dirs or ():
+            os.makedirs(os.path.join(self.consumer_repo_s, dest_dir), exist_ok=True)
+
+    def _assert_files_exist(self, *rel_paths):
+        """
+        Description:
+            Asserts that the given files exist in the consumer repository, listing each
+            parent directory once with os.scandir instead of a stat per file.
+        
+        Parameters:
+            *rel_paths (str): Consumer-relative file paths expected to exist.
 
         Returns:
             None
         """
-        repo_reqs = "requests==2.27.1\nflask==2.0.0\nnumpy==1.21.0\n"
-        neuron_reqs = "requests==2.28.1\npandas==1.4.2\nnumpy==1.22.0\n" 
+        expected_by_dir = {}
+        for rel_path in rel_paths:
+            parent_dir, name = os.path.split(rel_path)
+            expected_by_dir.setdefault(parent_dir, set()).add(name)
+        for parent_dir, names in expected_by_dir.items():
+            try:
+                with os.scandir(os.path.join(self.consumer_repo_s, parent_dir)) as entries:
+                    present = {entry.name for entry in entries}
+            except FileNotFoundError:
+                present = set()
+            missing = names - present
+            self.assertFalse(missing, f"Missing from consumer dir '{parent_dir or '.'}': {sorted(missing)}")
+
+    def _run_sync_parallel(self, config, tasks: list) -> list:
+        """
+        Description:
+            Runs sync_neuron for each task concurrently on a thread pool against the
+            consumer repository and returns the results in task order.
         
-        merged_content = merge_requirements(repo_reqs, neuron_reqs)
-        merged_deps = parse_requirements(merged_content)
+        Parameters:
+            config (dict): The loaded neuron configuration.
+            tasks (list): (brain ID, source path, destination path) tuples.
 
-        self.assertEqual(merged_deps.get('requests'), '2.28.1') 
-        self.assertEqual(merged_deps.get('flask'), '2.0.0')    
-        self.assertEqual(merged_deps.get('pandas'), '1.4.2')   
-        self.assertEqual(merged_deps.get('numpy'), '1.22.0') 
+        Returns:
+            results (list): The sync_neuron result of each task.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+            futures = [executor.submit(sync_neuron, config, *task, self.consumer_repo_s) for task in tasks]
+            return [future.result() for future in futures]
 
     @mock.patch('brain.sync.handle_conflicts') 
     def test_sync_neuron_file_with_requirements(self, mock_handle_conflicts):
@@ -212,25 +418,21 @@ class TestNeuronSync(unittest.TestCase):
         # STEP 1: Set up test environment.
         # --------------------------------------------------------------
         mock_handle_conflicts.return_value = {'resolution': 'brain', 'content': b"mock"}
-        (self.consumer_repo / '.neurons').write_text(
-            self.base_neurons_content + "map_s = sync-brain::libs/utils/strings.py::consumer_code/strings.py\n"
-        )
-        (self.consumer_repo / 'requirements.txt').write_text("existing_pkg==1.0\nrequests==2.20.0\n")
-        
-        # Create parent dir for neuron destination
-        (self.consumer_repo / 'consumer_code').mkdir(exist_ok=True)
+        # Also creates the parent dir for the neuron destination
+        self._prepare_consumer([NeuronMap('map_s', 'libs/utils/strings.py', 'consumer_code/strings.py')],
+                               {'requirements.txt': b"existing_pkg==1.0\nrequests==2.20.0\n"}, ['consumer_code'])
 
         # --------------------------------------------------------------
         # STEP 2: Execute sync_neuron function.
         # --------------------------------------------------------------
         config = self._get_consumer_config()
-        result = sync_neuron(config, 'sync-brain', 'libs/utils/strings.py', 'consumer_code/strings.py', str(self.consumer_repo))
+        result = sync_neuron(config, 'sync-brain', 'libs/utils/strings.py', 'consumer_code/strings.py', self.consumer_repo_s)
         
         # --------------------------------------------------------------
         # STEP 3: Verify sync results.
         # --------------------------------------------------------------
         self.assertEqual(result['status'], 'success', f"Sync neuron failed: {result.get('message')}")
-        self.assertTrue((self.consumer_repo / 'consumer_code/strings.py').exists())
+        self._assert_files_exist('consumer_code/strings.py')
         # requirements_merged can be True even if the content is the same if merge logic ran.
         # More important is to check the actual content of requirements.txt.
         # self.assertTrue(result['requirements_merged']) 
@@ -256,25 +458,21 @@ class TestNeuronSync(unittest.TestCase):
         # STEP 1: Set up test environment.
         # --------------------------------------------------------------
         mock_handle_conflicts.return_value = {'resolution': 'brain', 'content': b"mock"}
-        (self.consumer_repo / '.neurons').write_text(
-            self.base_neurons_content + "map_d = sync-brain::dir_neuron/::consumer_dir/\n"
-        )
-        (self.consumer_repo / 'requirements.txt').write_text("original_req==1.0\nnumpy==1.19.0\n") 
-        
-        # Create parent dir for neuron destination if needed (sync_neuron should also do this)
-        (self.consumer_repo / 'consumer_dir').mkdir(exist_ok=True, parents=True)
+        # Also creates the neuron destination dir (sync_neuron should also do this)
+        self._prepare_consumer([NeuronMap('map_d', 'dir_neuron/', 'consumer_dir/')],
+                               {'requirements.txt': b"original_req==1.0\nnumpy==1.19.0\n"}, ['consumer_dir'])
 
         # --------------------------------------------------------------
         # STEP 2: Execute sync_neuron function.
         # --------------------------------------------------------------
         config = self._get_consumer_config()
-        result = sync_neuron(config, 'sync-brain', 'dir_neuron/', 'consumer_dir/', str(self.consumer_repo))
+        result = sync_neuron(config, 'sync-brain', 'dir_neuron/', 'consumer_dir/', self.consumer_repo_s)
 
         # --------------------------------------------------------------
         # STEP 3: Verify sync results.
         # --------------------------------------------------------------
         self.assertEqual(result['status'], 'success', f"Sync neuron (dir) failed: {result.get('message')}")
-        self.assertTrue((self.consumer_repo / 'consumer_dir/file_a.txt').exists())
+        self._assert_files_exist('consumer_dir/file_a.txt')
         
         req_text = (self.consumer_repo / 'requirements.txt').read_text()
         self.assertIn('numpy==1.22.0', req_text) 
@@ -295,31 +493,28 @@ class TestNeuronSync(unittest.TestCase):
         # --------------------------------------------------------------
         # STEP 1: Set up test environment with mapped neurons.
         # --------------------------------------------------------------
-        (self.consumer_repo / '.neurons').write_text(
-             self.base_neurons_content +
-             "map_f = sync-brain::config/settings.json::cfg/settings.json\n" +
-             "map_d = sync-brain::dir_neuron/::my_local_dir/\n"
-        )
+        # Also creates the directories for neurons before syncing
+        self._prepare_consumer([NeuronMap('map_f', 'config/settings.json', 'cfg/settings.json'),
+                                NeuronMap('map_d', 'dir_neuron/', 'my_local_dir/')],
+                               dest_dirs=['cfg', 'my_local_dir'])
         config = self._get_consumer_config()
 
-        # Create directories for neurons before syncing
-        (self.consumer_repo / 'cfg').mkdir(exist_ok=True)
-        (self.consumer_repo / 'my_local_dir').mkdir(exist_ok=True)
-
         # --------------------------------------------------------------
         # STEP 2: Sync and commit initial state.
         # --------------------------------------------------------------
-        sync_all_neurons(config, str(self.consumer_repo))
-        run_git_in_path(str(self.consumer_repo), ['add', '.'])
-        run_git_in_path(str(self.consumer_repo), ['commit', '-m', 'Initial consumer content for get_modified test'])
+        sync_all_neurons(config, self.consumer_repo_s)
+        run_git_in_path(self.consumer_repo_s, ['add', '.'])
+        run_git_in_path(self.consumer_repo_s, ['commit', '-m', 'Initial consumer content for get_modified test'])
 
         # --------------------------------------------------------------
         # STEP 3: Modify neurons and check detection.
         # --------------------------------------------------------------
-        (self.consumer_repo / 'cfg/settings.json').write_text('{"consumer_mod": true}')
-        (self.consumer_repo / 'my_local_dir/file_a.txt').write_text('Local edit in dir neuron file')
+        _write_files(self.consumer_repo_s, {
+            'cfg/settings.json': b'{"consumer_mod": true}',
+            'my_local_dir/file_a.txt': b'Local edit in dir neuron file',
+        })
 
-        modified = get_modified_neurons(config, str(self.consumer_repo))
+        modified = get_modified_neurons(config, self.consumer_repo_s)
         
         self.assertEqual(len(modified), 2, f"Expected 2 modified neurons, got {len(modified)}: {modified}")
         
@@ -344,20 +539,16 @@ class TestNeuronSync(unittest.TestCase):
         # STEP 1: Set up test environment with mapped neurons.
         # --------------------------------------------------------------
         mock_handle_conflicts.return_value = {'resolution': 'brain', 'content': b"mock_all_sync"}
-        (self.consumer_repo / '.neurons').write_text(
-             self.base_neurons_content +
-             "map_s = sync-brain::libs/utils/strings.py::c/s.py\n" +
-             "map_c = sync-brain::config/settings.json::c/set.json\n"
-        )
+        # Also creates the parent dir for neuron destinations
+        self._prepare_consumer([NeuronMap('map_s', 'libs/utils/strings.py', 'c/s.py'),
+                                NeuronMap('map_c', 'config/settings.json', 'c/set.json')],
+                               dest_dirs=['c'])
         config = self._get_consumer_config()
 
-        # Create parent dir for neuron destinations
-        (self.consumer_repo / 'c').mkdir(exist_ok=True)
-
         # --------------------------------------------------------------
         # STEP 2: Execute sync_all_neurons function.
         # --------------------------------------------------------------
-        results = sync_all_neurons(config, str(self.consumer_repo))
+        results = sync_all_neurons(config, self.consumer_repo_s)
         
         # --------------------------------------------------------------
         # STEP 3: Verify sync results.
@@ -366,8 +557,57 @@ class TestNeuronSync(unittest.TestCase):
         for r_idx, r_val in enumerate(results):
             self.assertEqual(r_val['status'], 'success', f"Sync all, item {r_idx} failed: {r_val.get('message')}")
         
-        self.assertTrue((self.consumer_repo / 'c/s.py').exists())
-        self.assertTrue((self.consumer_repo / 'c/set.json').exists())
+        self._assert_files_exist('c/s.py', 'c/set.json')
+        self.assertEqual((self.consumer_repo / 'c/s.py').read_bytes(),
+                         self.brain_objects.get(self.initial_git_branch_name, 'libs/utils/strings.py'))
+        self.assertEqual((self.consumer_repo / 'c/set.json').read_bytes(),
+                         self.brain_objects.get(self.initial_git_branch_name, 'config/settings.json'))
+
+    @mock.patch('brain.sync.handle_conflicts')
+    def test_sync_neurons_parallel_equivalent_to_sync_all(self, mock_handle_conflicts):
+        """
+        Description:
+            Tests that syncing the mapped neurons concurrently with sync_neuron gives
+            the same results and files as sync_all_neurons, whatever the completion order.
+            The neurons carry no requirements files, since concurrent merges into the
+            consumer's requirements.txt are not serialized.
+        
+        Parameters:
+            mock_handle_conflicts (MagicMock): Mock for the handle_conflicts function.
+
+        Returns:
+            None
+        """
+        # --------------------------------------------------------------
+        # STEP 1: Set up test environment with mapped neurons.
+        # --------------------------------------------------------------
+        mock_handle_conflicts.return_value = {'resolution': 'brain', 'content': b"mock_parallel_sync"}
+        neuron_maps = [NeuronMap('map_n', 'libs/utils/numbers.py', 'c/n.py'),
+                       NeuronMap('map_c', 'config/settings.json', 'c/set.json'),
+                       NeuronMap('map_p', 'plain_dir/', 'c/dir/')]
+        self._prepare_consumer(neuron_maps, dest_dirs=['c'])
+        config = self._get_consumer_config()
+
+        # --------------------------------------------------------------
+        # STEP 2: Sync serially, then again concurrently into a cleared destination.
+        # --------------------------------------------------------------
+        serial_results = sync_all_neurons(config, self.consumer_repo_s)
+        shutil.rmtree(os.path.join(self.consumer_repo_s, 'c'))
+        os.mkdir(os.path.join(self.consumer_repo_s, 'c'))
+        parallel_results = self._run_sync_parallel(config, [(m.brain, m.src, m.dst) for m in neuron_maps])
+
+        # --------------------------------------------------------------
+        # STEP 3: Verify both paths agree.
+        # --------------------------------------------------------------
+        serial_outcome = {(r['status'], r['mapping']['destination']) for r in serial_results}
+        parallel_outcome = {(r['status'], r['mapping']['destination']) for r in parallel_results}
+        self.assertEqual(parallel_outcome, serial_outcome)
+        self.assertEqual(parallel_outcome, {('success', m.dst) for m in neuron_maps})
+        self.assertFalse(any(r['requirements_merged'] for r in parallel_results))
+        self._assert_files_exist('c/n.py', 'c/set.json', 'c/dir/file_b.txt')
+        for dst, src in [(m.dst, m.src) for m in neuron_maps[:2]] + [('c/dir/file_b.txt', 'plain_dir/file_b.txt')]:
+            self.assertEqual((self.consumer_repo / dst).read_bytes(),
+                             self.brain_objects.get(self.initial_git_branch_name, src))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file